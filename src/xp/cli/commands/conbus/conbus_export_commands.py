@@ -35,16 +35,15 @@ def export_conbus_config(ctx: click.Context) -> None:
         xp conbus export config
     """
 
-    def on_progress(serial_number: str, current: int, total: int) -> None:
+    def on_progress(batch: list[tuple[str, int, int]]) -> None:
         """
         Handle progress updates during export.
 
         Args:
-            serial_number: Serial number of discovered device.
-            current: Current device number.
-            total: Total devices discovered.
+            batch: Discovered devices as (serial_number, current, total) tuples.
         """
-        click.echo(f"Querying device {current}/{total}: {serial_number}...")
+        for serial_number, current, total in batch:
+            click.echo(f"Querying device {current}/{total}: {serial_number}...")
 
     def on_device_exported(module: ConsonModuleConfig) -> None:
         """
@@ -17,6 +17,20 @@ from xp.services.conbus.write_config_service import WriteConfigService
 from xp.services.telegram.telegram_datapoint_service import TelegramDatapointService
 
 
+def _format_lightlevel(output_number: int, level: int) -> str:
+    """
+    Format the MODULE_LIGHT_LEVEL data value for an output.
+
+    Args:
+        output_number: Output number (0-8).
+        level: Light level (0-100).
+
+    Returns:
+        Data value in the "output:level" format (e.g. "02:050").
+    """
+    return f"{output_number:02d}:{level:03d}"
+
+
 @conbus_lightlevel.command("set")
 @click.argument("serial_number", type=SERIAL)
 @click.argument("output_number", type=click.IntRange(0, 8))
@@ -54,7 +68,7 @@ def xp_lightlevel_set(
         click.echo(json.dumps(response.to_dict(), indent=2))
         service.stop_reactor()
 
-    data_value = f"{output_number:02d}:{level:03d}"
+    data_value = _format_lightlevel(output_number, level)
 
     with service:
         service.on_finish.connect(on_finish)
@@ -102,8 +116,7 @@ def xp_lightlevel_off(
         click.echo(json.dumps(response.to_dict(), indent=2))
         service.stop_reactor()
 
-    level = 0
-    data_value = f"{output_number:02d}:{level:03d}"
+    data_value = _format_lightlevel(output_number, 0)
 
     with service:
         service.on_finish.connect(on_finish)
@@ -151,8 +164,7 @@ def xp_lightlevel_on(
         click.echo(json.dumps(response.to_dict(), indent=2))
         service.stop_reactor()
 
-    level = 60
-    data_value = f"{output_number:02d}:{level:03d}"
+    data_value = _format_lightlevel(output_number, 60)
 
     with service:
         service.on_finish.connect(on_finish)
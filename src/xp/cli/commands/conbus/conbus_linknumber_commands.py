@@ -16,6 +16,9 @@ from xp.services.conbus.conbus_datapoint_service import ConbusDatapointService
 from xp.services.conbus.write_config_service import WriteConfigService
 from xp.services.telegram.telegram_datapoint_service import TelegramDatapointService
 
+# Zero-padded data values for every legal link number (0-99)
+_LINK_NUMBER_DATA_VALUES = tuple(f"{i:02d}" for i in range(100))
+
 
 @conbus_linknumber.command("set", short_help="Set link number for a module")
 @click.argument("serial_number", type=SERIAL)
@@ -51,7 +54,7 @@ def set_linknumber_command(
         click.echo(json.dumps(response.to_dict(), indent=2))
         service.stop_reactor()
 
-    data_value = f"{link_number:02d}"
+    data_value = _LINK_NUMBER_DATA_VALUES[link_number]
     with service:
         service.on_finish.connect(on_finish)
         service.write_config(
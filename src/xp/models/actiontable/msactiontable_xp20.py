@@ -1,7 +1,13 @@
 """XP20 Action Table models for input actions and settings."""
 
+import re
+
 from pydantic import BaseModel, Field
 
+_CHANNEL_PATTERN = re.compile(
+    r"^CH([1-8]) I:([01]) S:([01]) G:([01]) AND:([01]{8}) SA:([01]) TA:([01])$"
+)
+
 
 class InputChannel(BaseModel):
     """
@@ -94,19 +100,13 @@ class Xp20MsActionTable(BaseModel):
         Raises:
             ValueError: If format is invalid.
         """
-        import re
-
         if len(short_str) != 8:
             raise ValueError(f"Expected 8 channel lines, got {len(short_str)}")
 
-        pattern = re.compile(
-            r"^CH([1-8]) I:([01]) S:([01]) G:([01]) AND:([01]{8}) SA:([01]) TA:([01])$"
-        )
-
         channels = {}
         for line in short_str:
             line = line.strip()
-            match = pattern.match(line)
+            match = _CHANNEL_PATTERN.match(line)
             if not match:
                 raise ValueError(f"Invalid channel format: {line}")
 
@@ -1,11 +1,12 @@
 """Conbus client configuration models."""
 
 import logging
-from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, Field
 
+from xp.utils.yaml_loader import load_yaml
+
 
 class ClientConfig(BaseModel):
     """
@@ -47,9 +48,8 @@ class ConbusClientConfig(BaseModel):
         """
         logger = logging.getLogger(__name__)
         try:
-            with Path(file_path).open("r") as file:
-                data = yaml.safe_load(file)
-                return cls(**data)
+            data = load_yaml(file_path)
+            return cls(**data)
 
         except FileNotFoundError:
             logger.error(f"File {file_path} does not exist, loading default")
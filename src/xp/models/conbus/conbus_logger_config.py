@@ -1,12 +1,13 @@
 """Logger configuration models for XP application."""
 
 import logging
-from pathlib import Path
 from typing import Dict, Union
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+from xp.utils.yaml_loader import load_yaml
+
 
 class LoggingConfig(BaseModel):
     """
@@ -97,9 +98,8 @@ class ConbusLoggerConfig(BaseModel):
         """
         logger = logging.getLogger(__name__)
         try:
-            with Path(file_path).open("r") as file:
-                data = yaml.safe_load(file)
-                return cls(**data)
+            data = load_yaml(file_path)
+            return cls(**data)
 
         except FileNotFoundError:
             logger.error(f"File {file_path} does not exist, loading default")
@@ -6,6 +6,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, IPvAnyAddress
 
+from xp.utils.yaml_loader import load_yaml
+
 
 class ConsonModuleConfig(BaseModel):
     """
@@ -69,15 +71,12 @@ class ConsonModuleListConfig(BaseModel):
         Returns:
             ConsonModuleListConfig instance loaded from file or default config.
         """
-        import yaml
-
         if not Path(file_path).exists():
             logger = logging.getLogger(__name__)
             logger.error(f"File {file_path} does not exist, loading default")
             return cls()
 
-        with Path(file_path).open("r") as file:
-            data = yaml.safe_load(file)
+        data = load_yaml(file_path)
         return cls(root=data)
 
     def find_module(self, serial_number: str) -> Optional[ConsonModuleConfig]:
@@ -5,9 +5,10 @@ from ipaddress import IPv4Address, IPv6Address
 from pathlib import Path
 from typing import List, Optional, Union
 
-import yaml
 from pydantic import BaseModel, Field, IPvAnyAddress
 
+from xp.utils.yaml_loader import load_yaml
+
 
 class NetworkConfig(BaseModel):
     """
@@ -121,6 +122,5 @@ class HomekitConfig(BaseModel):
             logger.error(f"File {file_path} does not exist, loading default")
             return cls()
 
-        with Path(file_path).open("r") as file:
-            data = yaml.safe_load(file)
+        data = load_yaml(file_path)
         return cls(**data)
@@ -280,6 +280,17 @@ class TelegramEvent(BaseModel):
         default=True, description="Checksum valid: true, or false"
     )
 
+    def __str__(self) -> str:
+        """
+        Return the frame, keeping log lines short.
+
+        Returns:
+            Frame string, flagged when the checksum is invalid.
+        """
+        if self.checksum_valid:
+            return self.frame
+        return f"{self.frame} (invalid checksum)"
+
 
 class ModuleStateChangedEvent(BaseModel):
     """
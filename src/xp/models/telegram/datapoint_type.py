@@ -108,7 +108,7 @@ class DataPointType(str, Enum):
         Returns:
             DataPointType instance if found, None otherwise.
         """
-        for dp_type in cls:
-            if dp_type.value == code:
-                return dp_type
-        return None
+        try:
+            return cls(code)
+        except ValueError:
+            return None
@@ -204,3 +204,12 @@ MODULE_TYPE_REGISTRY: Dict[int, Dict[str, str]] = {
         "description": "XP 1 channel LED dimmer",
     },
 }
+
+# Module type codes of the XP33 3-channel dimmer variants
+XP33_MODULE_TYPE_CODES = frozenset(
+    {
+        ModuleTypeCode.XP33.value,
+        ModuleTypeCode.XP33LR.value,
+        ModuleTypeCode.XP33LED.value,
+    }
+)
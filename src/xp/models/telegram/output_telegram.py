@@ -15,6 +15,11 @@ from xp.models.telegram.action_type import ActionType
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram import Telegram
 
+_ACTION_DESCRIPTIONS: dict[Optional[ActionType], str] = {
+    ActionType.OFF_PRESS: "Press (Make)",
+    ActionType.ON_RELEASE: "Release (Break)",
+}
+
 
 @dataclass
 class OutputTelegram(Telegram):
@@ -53,15 +58,7 @@ class OutputTelegram(Telegram):
         Returns:
             Human-readable description of the action.
         """
-        descriptions = {
-            ActionType.OFF_PRESS: "Press (Make)",
-            ActionType.ON_RELEASE: "Release (Break)",
-        }
-        return (
-            descriptions.get(self.action_type, "Unknown Action")
-            if self.action_type
-            else "Unknown Action"
-        )
+        return _ACTION_DESCRIPTIONS.get(self.action_type, "Unknown Action")
 
     @property
     def input_description(self) -> str:
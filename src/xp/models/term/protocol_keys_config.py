@@ -3,9 +3,10 @@
 from pathlib import Path
 from typing import Dict
 
-import yaml
 from pydantic import BaseModel, Field
 
+from xp.utils.yaml_loader import load_yaml
+
 
 class ProtocolKeyConfig(BaseModel):
     """
@@ -43,6 +44,5 @@ class ProtocolKeysConfig(BaseModel):
         Returns:
             ProtocolKeysConfig instance.
         """
-        with config_path.open("r") as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(config_path)
         return cls(**data)
@@ -74,33 +74,29 @@ class Xp24MsActionTableSerializer(ActionTableSerializerProtocol):
         Returns:
             Serialized action table data string (64 characters).
         """
-        # Build byte array for the action table (32 bytes total)
-        raw_bytes = bytearray()
+        # Fixed 32-byte action table, zero padded after the settings bytes
+        raw_bytes = bytearray(32)
 
         # Encode all 4 input actions (2 bytes each = 8 bytes total)
-        input_actions = [
+        input_actions = (
             action_table.input1_action,
             action_table.input2_action,
             action_table.input3_action,
             action_table.input4_action,
-        ]
-
-        for action in input_actions:
-            raw_bytes.append(action.type.value)
-            raw_bytes.append(action.param.value)
+        )
 
-        # Add settings (5 bytes)
-        raw_bytes.append(0x01 if action_table.mutex12 else 0x00)
-        raw_bytes.append(0x01 if action_table.mutex34 else 0x00)
-        raw_bytes.append(action_table.mutual_deadtime)
-        raw_bytes.append(0x01 if action_table.curtain12 else 0x00)
-        raw_bytes.append(0x01 if action_table.curtain34 else 0x00)
+        for index, action in enumerate(input_actions):
+            raw_bytes[2 * index] = action.type.value
+            raw_bytes[2 * index + 1] = action.param.value
 
-        # Add padding to reach 32 bytes (19 more bytes needed)
-        raw_bytes.extend([0x00] * 19)
+        # Add settings (bytes 8-12)
+        raw_bytes[8] = 0x01 if action_table.mutex12 else 0x00
+        raw_bytes[9] = 0x01 if action_table.mutex34 else 0x00
+        raw_bytes[10] = action_table.mutual_deadtime
+        raw_bytes[11] = 0x01 if action_table.curtain12 else 0x00
+        raw_bytes[12] = 0x01 if action_table.curtain34 else 0x00
 
-        # Build byte array for the action table (32 bytes total)
-        # Prepend action table count "AAAA" (4 chars) -> total 68 chars
+        # Bytes 13-31 are padding (already 0)
         return nibbles(raw_bytes)
 
     @staticmethod
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from psygnal import Signal
 
@@ -30,6 +30,9 @@ from xp.services.protocol.conbus_event_protocol import (
     ConbusEventProtocol,
 )
 
+# Maximum number of decoded actiontables kept for reuse
+DECODED_CACHE_SIZE = 32
+
 
 class ActionTableDownloadService(DownloadStateMachine):
     """
@@ -92,10 +95,22 @@ class ActionTableDownloadService(DownloadStateMachine):
         self.msactiontable_serializer_xp24 = msactiontable_serializer_xp24
         self.msactiontable_serializer_xp33 = msactiontable_serializer_xp33
         self.serializer: ActionTableSerializerProtocol = actiontable_serializer
+        self._serializers: dict[ActionTableType, ActionTableSerializerProtocol] = {
+            ActionTableType.ACTIONTABLE: actiontable_serializer,
+            ActionTableType.MSACTIONTABLE_XP20: msactiontable_serializer_xp20,
+            ActionTableType.MSACTIONTABLE_XP24: msactiontable_serializer_xp24,
+            ActionTableType.MSACTIONTABLE_XP33: msactiontable_serializer_xp33,
+        }
 
         self.serial_number: str = ""
         self.actiontable_data: list[str] = []
         self._signals_connected: bool = False
+        # Decoded tables keyed by (serializer, encoded data); identical tables
+        # are common across modules of a bulk export. Entries are never handed
+        # out directly, callers get copies they are free to mutate.
+        self._decoded_cache: dict[
+            tuple[ActionTableSerializerProtocol, str], tuple[Any, tuple[str, ...]]
+        ] = {}
 
         # Initialize state machine (must be last - triggers introspection)
         super().__init__()
@@ -103,6 +118,23 @@ class ActionTableDownloadService(DownloadStateMachine):
         # Override logger for service-specific logging
         self.logger = logging.getLogger(__name__)
 
+        # Protocol signal slots, bound once and reused on every reconnect
+        self._protocol_slots: tuple[tuple[Any, Callable[..., None]], ...] = (
+            (conbus_protocol.on_connection_made, self._on_connection_made),
+            (conbus_protocol.on_telegram_received, self._on_telegram_received),
+            (
+                conbus_protocol.on_read_datapoint_received,
+                self._on_read_datapoint_received,
+            ),
+            (
+                conbus_protocol.on_actiontable_chunk_received,
+                self._on_actiontable_chunk_received,
+            ),
+            (conbus_protocol.on_eof_received, self._on_eof_received),
+            (conbus_protocol.on_timeout, self._on_timeout),
+            (conbus_protocol.on_failed, self._on_failed),
+        )
+
         # Connect protocol signals
         self._connect_signals()
 
@@ -110,18 +142,18 @@ class ActionTableDownloadService(DownloadStateMachine):
 
     def on_enter_receiving(self) -> None:
         """Enter receiving state - wait for telegrams to drain."""
-        self.logger.debug(f"Entering RECEIVING state (phase={self.phase.value})")
+        self.logger.debug("Entering RECEIVING state (phase=%s)", self.phase.value)
         self.conbus_protocol.wait()
 
     def on_enter_resetting(self) -> None:
         """Enter resetting state - send error status query."""
-        self.logger.debug(f"Entering RESETTING state (phase={self.phase.value})")
+        self.logger.debug("Entering RESETTING state (phase=%s)", self.phase.value)
         self.conbus_protocol.send_error_status_query(serial_number=self.serial_number)
         self.send_error_status()
 
     def on_enter_waiting_ok(self) -> None:
         """Enter waiting_ok state - wait for error status response."""
-        self.logger.debug(f"Entering WAITING_OK state (phase={self.phase.value})")
+        self.logger.debug("Entering WAITING_OK state (phase=%s)", self.phase.value)
         self.conbus_protocol.wait()
 
     def on_enter_requesting(self) -> None:
@@ -148,12 +180,33 @@ class ActionTableDownloadService(DownloadStateMachine):
         """Enter processing_eof state - deserialize and emit result."""
         self.logger.debug("Entering PROCESSING_EOF state - deserializing")
         all_data = "".join(self.actiontable_data)
-        actiontable = self.serializer.from_encoded_string(all_data)
-        actiontable_short = self.serializer.to_short_string(actiontable)
+        actiontable, actiontable_short = self._decode_actiontable(all_data)
         self.on_actiontable_received.emit(actiontable, actiontable_short)
         # Switch to CLEANUP phase
         self.start_cleanup_phase()
 
+    def _decode_actiontable(self, all_data: str) -> tuple[Any, list[str]]:
+        """
+        Deserialize downloaded data, reusing earlier results for identical data.
+
+        Args:
+            all_data: Concatenated encoded actiontable chunks.
+
+        Returns:
+            Tuple of (actiontable, short format lines), both fresh copies.
+        """
+        key = (self.serializer, all_data)
+        decoded = self._decoded_cache.get(key)
+        if decoded is None:
+            if len(self._decoded_cache) >= DECODED_CACHE_SIZE:
+                self._decoded_cache.clear()
+            actiontable = self.serializer.from_encoded_string(all_data)
+            short = tuple(self.serializer.to_short_string(actiontable))
+            decoded = (actiontable, short)
+            self._decoded_cache[key] = decoded
+        actiontable, short = decoded
+        return actiontable.model_copy(deep=True), list(short)
+
     def on_enter_completed(self) -> None:
         """Enter completed state - emit finish signal."""
         self.logger.debug("Entering COMPLETED state - download finished")
@@ -161,7 +214,7 @@ class ActionTableDownloadService(DownloadStateMachine):
 
     def on_max_retries_exceeded(self) -> None:
         """Handle max retries exceeded - emit error signal."""
-        self.logger.error(f"Max error retries ({MAX_ERROR_RETRIES}) exceeded")
+        self.logger.error("Max error retries (%s) exceeded", MAX_ERROR_RETRIES)
         self.on_error.emit(f"Module error persists after {MAX_ERROR_RETRIES} retries")
 
     # Protocol event handlers
@@ -179,7 +232,7 @@ class ActionTableDownloadService(DownloadStateMachine):
         Args:
             reply_telegram: The parsed reply telegram.
         """
-        self.logger.debug(f"Received READ_DATAPOINT in {self.configuration}")
+        self.logger.debug("Received READ_DATAPOINT in %s", self.configuration)
         if reply_telegram.serial_number != self.serial_number:
             return
 
@@ -205,7 +258,7 @@ class ActionTableDownloadService(DownloadStateMachine):
             reply_telegram: The parsed reply telegram containing chunk data.
             actiontable_chunk: The chunk data.
         """
-        self.logger.debug(f"Received actiontable chunk in {self.configuration}")
+        self.logger.debug("Received actiontable chunk in %s", self.configuration)
         if reply_telegram.serial_number != self.serial_number:
             return
 
@@ -221,7 +274,7 @@ class ActionTableDownloadService(DownloadStateMachine):
         Args:
             reply_telegram: The parsed reply telegram (unused).
         """
-        self.logger.debug(f"Received EOF in {self.configuration}")
+        self.logger.debug("Received EOF in %s", self.configuration)
         if reply_telegram.serial_number != self.serial_number:
             return
 
@@ -235,7 +288,7 @@ class ActionTableDownloadService(DownloadStateMachine):
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Received {telegram_received} in {self.configuration}")
+        self.logger.debug("Received %s in %s", telegram_received, self.configuration)
 
         # In receiving state, drain pending telegrams from pipe (discard to /dev/null).
         # This ensures clean state before processing by clearing any stale messages.
@@ -245,7 +298,7 @@ class ActionTableDownloadService(DownloadStateMachine):
 
     def _on_timeout(self) -> None:
         """Handle timeout event."""
-        self.logger.debug(f"Timeout occurred (phase={self.phase.value})")
+        self.logger.debug("Timeout occurred (phase=%s)", self.phase.value)
         if self.receiving.is_active:
             self.do_timeout()  # receiving -> resetting
         elif self.waiting_ok.is_active:
@@ -264,7 +317,7 @@ class ActionTableDownloadService(DownloadStateMachine):
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed: {message}")
+        self.logger.debug("Failed: %s", message)
         self.on_error.emit(message)
 
     # Public API
@@ -295,14 +348,7 @@ class ActionTableDownloadService(DownloadStateMachine):
         self.serial_number = serial_number
         self.actiontable_data = []
 
-        if actiontable_type == ActionTableType.ACTIONTABLE:
-            self.serializer = self.actiontable_serializer
-        elif actiontable_type == ActionTableType.MSACTIONTABLE_XP20:
-            self.serializer = self.msactiontable_serializer_xp20
-        elif actiontable_type == ActionTableType.MSACTIONTABLE_XP24:
-            self.serializer = self.msactiontable_serializer_xp24
-        elif actiontable_type == ActionTableType.MSACTIONTABLE_XP33:
-            self.serializer = self.msactiontable_serializer_xp33
+        self.serializer = self._serializers.get(actiontable_type, self.serializer)
         if timeout_seconds:
             self.conbus_protocol.timeout_seconds = timeout_seconds
 
@@ -336,34 +382,16 @@ class ActionTableDownloadService(DownloadStateMachine):
         """Connect protocol signals to handlers (idempotent)."""
         if self._signals_connected:
             return
-        self.conbus_protocol.on_connection_made.connect(self._on_connection_made)
-        self.conbus_protocol.on_telegram_received.connect(self._on_telegram_received)
-        self.conbus_protocol.on_read_datapoint_received.connect(
-            self._on_read_datapoint_received
-        )
-        self.conbus_protocol.on_actiontable_chunk_received.connect(
-            self._on_actiontable_chunk_received
-        )
-        self.conbus_protocol.on_eof_received.connect(self._on_eof_received)
-        self.conbus_protocol.on_timeout.connect(self._on_timeout)
-        self.conbus_protocol.on_failed.connect(self._on_failed)
+        for signal, slot in self._protocol_slots:
+            signal.connect(slot)
         self._signals_connected = True
 
     def _disconnect_signals(self) -> None:
         """Disconnect protocol signals from handlers (idempotent)."""
         if not self._signals_connected:
             return
-        self.conbus_protocol.on_connection_made.disconnect(self._on_connection_made)
-        self.conbus_protocol.on_telegram_received.disconnect(self._on_telegram_received)
-        self.conbus_protocol.on_read_datapoint_received.disconnect(
-            self._on_read_datapoint_received
-        )
-        self.conbus_protocol.on_actiontable_chunk_received.disconnect(
-            self._on_actiontable_chunk_received
-        )
-        self.conbus_protocol.on_eof_received.disconnect(self._on_eof_received)
-        self.conbus_protocol.on_timeout.disconnect(self._on_timeout)
-        self.conbus_protocol.on_failed.disconnect(self._on_failed)
+        for signal, slot in self._protocol_slots:
+            signal.disconnect(slot)
         self._signals_connected = False
 
     def __enter__(self) -> "ActionTableDownloadService":
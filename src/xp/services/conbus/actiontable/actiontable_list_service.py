@@ -6,6 +6,8 @@ from typing import Any, Optional
 
 from psygnal import Signal
 
+from xp.models.config.conson_module_config import ConsonModuleListConfig
+
 
 class ActionTableListService:
     """
@@ -62,11 +64,9 @@ class ActionTableListService:
 
         # Load configuration
         try:
-            from xp.models.config.conson_module_config import ConsonModuleListConfig
-
             config = ConsonModuleListConfig.from_yaml(str(config_path))
         except Exception as e:
-            self.logger.error(f"Failed to load conson.yml: {e}")
+            self.logger.error("Failed to load conson.yml: %s", e)
             self._handle_error(f"Error: Failed to load conson.yml: {e}")
             return
 
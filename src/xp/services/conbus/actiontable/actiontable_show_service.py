@@ -4,7 +4,10 @@ import logging
 from pathlib import Path
 from typing import Any, Callable, Optional
 
-from xp.models.config.conson_module_config import ConsonModuleConfig
+from xp.models.config.conson_module_config import (
+    ConsonModuleConfig,
+    ConsonModuleListConfig,
+)
 
 
 class ActionTableShowService:
@@ -64,11 +67,9 @@ class ActionTableShowService:
 
         # Load configuration
         try:
-            from xp.models.config.conson_module_config import ConsonModuleListConfig
-
             config = ConsonModuleListConfig.from_yaml(str(config_path))
         except Exception as e:
-            self.logger.error(f"Failed to load conson.yml: {e}")
+            self.logger.error("Failed to load conson.yml: %s", e)
             self._handle_error(f"Error: Failed to load conson.yml: {e}")
             return
 
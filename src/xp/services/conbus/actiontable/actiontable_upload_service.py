@@ -1,7 +1,7 @@
 """Service for uploading ActionTable via Conbus protocol."""
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from psygnal import Signal
 
@@ -23,7 +23,11 @@ from xp.services.actiontable.msactiontable_xp24_serializer import (
 from xp.services.actiontable.msactiontable_xp33_serializer import (
     Xp33MsActionTableSerializer,
 )
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.actiontable.serializer_protocol import ActionTableSerializerProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
 from xp.services.telegram.telegram_service import TelegramService
 
 
@@ -68,6 +72,8 @@ class ActionTableUploadService:
             conson_config: Conson module list configuration.
         """
         self.conbus_protocol = conbus_protocol
+        # Bound once, called for every uploaded chunk
+        self._send_telegram = conbus_protocol.send_telegram
         self.actiontable_serializer = actiontable_serializer
         self.xp20ms_serializer = xp20ms_serializer
         self.xp24ms_serializer = xp24ms_serializer
@@ -83,6 +89,19 @@ class ActionTableUploadService:
         self.current_chunk_index: int = 0
         self._eof_sent: bool = False
 
+        # Upload reply dispatch by system function
+        self._reply_handlers: dict[SystemFunction, Callable[[], None]] = {
+            SystemFunction.ACK: self._handle_ack,
+            SystemFunction.NAK: self._handle_nak,
+        }
+
+        # MS action table serializer and config field by module type
+        self._ms_serializers: dict[str, tuple[ActionTableSerializerProtocol, str]] = {
+            "xp20": (xp20ms_serializer, "xp20_msaction_table"),
+            "xp24": (xp24ms_serializer, "xp24_msaction_table"),
+            "xp33": (xp33ms_serializer, "xp33_msaction_table"),
+        }
+
         # Set up logging
         self.logger = logging.getLogger(__name__)
 
@@ -103,7 +122,7 @@ class ActionTableUploadService:
             else SystemFunction.UPLOAD_MSACTIONTABLE
         )
 
-        self.conbus_protocol.send_telegram(
+        self._send_telegram(
             telegram_type=TelegramType.SYSTEM,
             serial_number=self.serial_number,
             system_function=system_function,
@@ -117,7 +136,7 @@ class ActionTableUploadService:
         Args:
             telegram_sent: The telegram that was sent.
         """
-        self.logger.debug(f"Telegram sent: {telegram_sent}")
+        self.logger.debug("Telegram sent: %s", telegram_sent)
 
     def telegram_received(self, telegram_received: TelegramReceivedEvent) -> None:
         """
@@ -126,10 +145,10 @@ class ActionTableUploadService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if (
             not telegram_received.checksum_valid
-            or telegram_received.telegram_type != TelegramType.REPLY.value
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
             or telegram_received.serial_number != self.serial_number
         ):
             self.logger.debug("Not a reply response")
@@ -148,53 +167,59 @@ class ActionTableUploadService:
         Args:
             reply_telegram: Parsed reply telegram.
         """
-        if reply_telegram.system_function == SystemFunction.ACK:
-            self.logger.debug("Received ACK for upload")
-            # Send next chunk or EOF
-            if self.current_chunk_index < len(self.upload_data_chunks):
-                chunk = self.upload_data_chunks[self.current_chunk_index]
-                self.logger.debug(f"Sending chunk {self.current_chunk_index + 1}")
-
-                # Calculate prefix: AA, AB, AC, AD, AE, AF, AG, AH, AI, AJ, AK, AL, AM, AN, AO
-                # First character: 'A' (fixed)
-                # Second character: 'A' + chunk_index (sequential counter A-O for 15 chunks)
-                prefix_hex = f"AAA{ord('A') + self.current_chunk_index:c}"
-
-                system_function = (
-                    SystemFunction.ACTIONTABLE
-                    if self.actiontable_type == ActionTableType2.ACTIONTABLE
-                    else SystemFunction.MSACTIONTABLE
-                )
-
-                self.conbus_protocol.send_telegram(
-                    telegram_type=TelegramType.SYSTEM,
-                    serial_number=self.serial_number,
-                    system_function=system_function,
-                    data_value=f"{prefix_hex}{chunk}",
-                )
-                self.current_chunk_index += 1
-                self.on_progress.emit(".")
-            elif not self._eof_sent:
-                # All chunks sent, send EOF
-                self.logger.debug("All chunks sent, sending EOF")
-                self.conbus_protocol.send_telegram(
-                    telegram_type=TelegramType.SYSTEM,
-                    serial_number=self.serial_number,
-                    system_function=SystemFunction.EOF,
-                    data_value="00",
-                )
-                self.on_progress.emit("END")
-                self.logger.debug("EOF sent, waiting for last ACK")
-                self._eof_sent = True
-            else:
-                self.logger.debug("Last ACK received, closing connection")
-                self.on_finish.emit(True)
-
-        elif reply_telegram.system_function == SystemFunction.NAK:
-            self.logger.debug("Received NAK during upload")
-            self.failed("Upload failed: NAK received")
+        handler = self._reply_handlers.get(reply_telegram.system_function)
+        if handler is None:
+            self.logger.debug("Unexpected response during upload: %s", reply_telegram)
+            return
+        handler()
+
+    def _handle_ack(self) -> None:
+        """Handle ACK during upload: send next chunk, then EOF, then finish."""
+        self.logger.debug("Received ACK for upload")
+        # Send next chunk or EOF
+        if self.current_chunk_index < len(self.upload_data_chunks):
+            chunk = self.upload_data_chunks[self.current_chunk_index]
+            self.logger.debug("Sending chunk %s", self.current_chunk_index + 1)
+
+            # Calculate prefix: AA, AB, AC, AD, AE, AF, AG, AH, AI, AJ, AK, AL, AM, AN, AO
+            # First character: 'A' (fixed)
+            # Second character: 'A' + chunk_index (sequential counter A-O for 15 chunks)
+            prefix_hex = f"AAA{ord('A') + self.current_chunk_index:c}"
+
+            system_function = (
+                SystemFunction.ACTIONTABLE
+                if self.actiontable_type == ActionTableType2.ACTIONTABLE
+                else SystemFunction.MSACTIONTABLE
+            )
+
+            self._send_telegram(
+                telegram_type=TelegramType.SYSTEM,
+                serial_number=self.serial_number,
+                system_function=system_function,
+                data_value=f"{prefix_hex}{chunk}",
+            )
+            self.current_chunk_index += 1
+            self.on_progress.emit(".")
+        elif not self._eof_sent:
+            # All chunks sent, send EOF
+            self.logger.debug("All chunks sent, sending EOF")
+            self._send_telegram(
+                telegram_type=TelegramType.SYSTEM,
+                serial_number=self.serial_number,
+                system_function=SystemFunction.EOF,
+                data_value="00",
+            )
+            self.on_progress.emit("END")
+            self.logger.debug("EOF sent, waiting for last ACK")
+            self._eof_sent = True
         else:
-            self.logger.debug(f"Unexpected response during upload: {reply_telegram}")
+            self.logger.debug("Last ACK received, closing connection")
+            self.on_finish.emit(True)
+
+    def _handle_nak(self) -> None:
+        """Handle NAK during upload."""
+        self.logger.debug("Received NAK during upload")
+        self.failed("Upload failed: NAK received")
 
     def timeout(self) -> None:
         """Handle timeout event."""
@@ -208,7 +233,7 @@ class ActionTableUploadService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed: {message}")
+        self.logger.debug("Failed: %s", message)
         self.on_error.emit(message)
 
     def start(
@@ -253,13 +278,14 @@ class ActionTableUploadService:
             self.current_chunk_index = 0
 
         except ValueError as e:
-            self.logger.error(f"Invalid action table format: {e}")
+            self.logger.error("Invalid action table format: %s", e)
             self.failed(f"Invalid action table format: {e}")
             return
 
         self.logger.debug(
-            f"Upload data encoded: {len(encoded_data)} chars, "
-            f"{len(self.upload_data_chunks)} chunks"
+            "Upload data encoded: %s chars, %s chunks",
+            len(encoded_data),
+            len(self.upload_data_chunks),
         )
 
     def get_encoded_action_table(self, module: ConsonModuleConfig) -> str:
@@ -272,35 +298,17 @@ class ActionTableUploadService:
         Returns:
             Hex-encoded action table string ready for transmission.
         """
-        msactiontable = (
-            True if self.actiontable_type == ActionTableType2.MSACTIONTABLE else False
-        )
-        # Parse MS action table from short format (first element)
-        if msactiontable and module.module_type.lower() == "xp20":
-            xp20_short_table = module.xp20_msaction_table or []
-            xp20_actiontable = self.xp20ms_serializer.from_short_string(
-                xp20_short_table
-            )
-            encoded_string = self.xp20ms_serializer.to_encoded_string(xp20_actiontable)
-        elif msactiontable and module.module_type.lower() == "xp24":
-            xp24_short_table = module.xp24_msaction_table or []
-            xp24_actiontable = self.xp24ms_serializer.from_short_string(
-                xp24_short_table
-            )
-            encoded_string = self.xp24ms_serializer.to_encoded_string(xp24_actiontable)
-        elif msactiontable and module.module_type.lower() == "xp33":
-            xp33_short_table = module.xp33_msaction_table or []
-            xp33_actiontable = self.xp33ms_serializer.from_short_string(
-                xp33_short_table
-            )
-            encoded_string = self.xp33ms_serializer.to_encoded_string(xp33_actiontable)
-        else:
-            short_table = module.action_table or []
-            actiontable = self.actiontable_serializer.from_short_string(short_table)
-            encoded_string = self.actiontable_serializer.to_encoded_string(actiontable)
-
-        # Serialize to telegram data (64 characters: AAAA + 64 data chars)
-        return encoded_string
+        serializer: ActionTableSerializerProtocol = self.actiontable_serializer
+        short_table = module.action_table
+        if self.actiontable_type == ActionTableType2.MSACTIONTABLE:
+            ms_entry = self._ms_serializers.get(module.module_type.lower())
+            if ms_entry is not None:
+                serializer, config_field = ms_entry
+                short_table = getattr(module, config_field)
+
+        # Parse from short format and serialize to telegram data
+        actiontable = serializer.from_short_string(short_table or [])
+        return serializer.to_encoded_string(actiontable)
 
     def set_timeout(self, timeout_seconds: float) -> None:
         """
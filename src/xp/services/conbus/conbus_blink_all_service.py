@@ -13,11 +13,20 @@ from psygnal import Signal
 
 from xp.models.conbus.conbus_blink import ConbusBlinkResponse
 from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
+from xp.models.telegram.reply_telegram import ReplyTelegram
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    REPLY_FUNCTION_CODE,
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
 from xp.services.telegram.telegram_service import TelegramService
 
+BLINK_FUNCTION_CODES = frozenset(
+    {SystemFunction.BLINK.value, SystemFunction.UNBLINK.value}
+)
+
 
 class ConbusBlinkAllService:
     """
@@ -50,12 +59,8 @@ class ConbusBlinkAllService:
         self.telegram_service = telegram_service
         self.serial_number: str = ""
         self.on_or_off = "none"
-        self.service_response: ConbusBlinkResponse = ConbusBlinkResponse(
-            success=False,
-            serial_number=self.serial_number,
-            system_function=SystemFunction.NONE,
-            operation=self.on_or_off,
-        )
+        self.system_function: SystemFunction = SystemFunction.UNBLINK
+        self.service_response: ConbusBlinkResponse = self._new_response()
 
         # Set up logging
         self.logger = logging.getLogger(__name__)
@@ -64,9 +69,25 @@ class ConbusBlinkAllService:
         self.conbus_protocol.on_connection_made.connect(self.connection_made)
         self.conbus_protocol.on_telegram_sent.connect(self.telegram_sent)
         self.conbus_protocol.on_telegram_received.connect(self.telegram_received)
+        self.conbus_protocol.on_discovery_received.connect(self.discovery_received)
         self.conbus_protocol.on_timeout.connect(self.timeout)
         self.conbus_protocol.on_failed.connect(self.failed)
 
+    @staticmethod
+    def _new_response() -> ConbusBlinkResponse:
+        """
+        Create an empty response for a new blink operation.
+
+        Returns:
+            Unsuccessful response with no system function or operation yet.
+        """
+        return ConbusBlinkResponse(
+            success=False,
+            serial_number="",
+            system_function=SystemFunction.NONE,
+            operation="none",
+        )
+
     def connection_made(self) -> None:
         """Handle connection made event."""
         self.logger.debug("Connection established, send discover telegram.")
@@ -86,19 +107,13 @@ class ConbusBlinkAllService:
             serial_number: 10-digit module serial number.
         """
         self.logger.debug("Device discovered, send blink.")
-
-        # Blink is 05, Unblink is 06
-        system_function = SystemFunction.UNBLINK
-        if self.on_or_off.lower() == "on":
-            system_function = SystemFunction.BLINK
-
         self.conbus_protocol.send_telegram(
             telegram_type=TelegramType.SYSTEM,
             serial_number=serial_number,
-            system_function=system_function,
+            system_function=self.system_function,
             data_value="00",
         )
-        self.service_response.system_function = system_function
+        self.service_response.system_function = self.system_function
         self.service_response.operation = self.on_or_off
 
         self.on_progress.emit(".")
@@ -120,39 +135,33 @@ class ConbusBlinkAllService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if not self.service_response.received_telegrams:
             self.service_response.received_telegrams = []
         self.service_response.received_telegrams.append(telegram_received.frame)
 
         if (
             not telegram_received.checksum_valid
-            or telegram_received.telegram_type != TelegramType.REPLY
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
         ):
             self.logger.debug("Not a reply")
             return
 
-        reply_telegram = self.telegram_service.parse_reply_telegram(
-            telegram_received.frame
-        )
-        if (
-            reply_telegram
-            and reply_telegram.system_function == SystemFunction.DISCOVERY
-        ):
-            self.logger.debug("Received discovery response")
-            self.send_blink(reply_telegram.serial_number)
-            self.on_progress.emit(".")
-            return
-
-        if reply_telegram and reply_telegram.system_function in (
-            SystemFunction.BLINK,
-            SystemFunction.UNBLINK,
-        ):
+        # Blink replies only drive progress, no need to parse them
+        if telegram_received.payload[REPLY_FUNCTION_CODE] in BLINK_FUNCTION_CODES:
             self.logger.debug("Received blink response")
             self.on_progress.emit(".")
-            return
 
-        self.logger.debug("Received unexpected response")
+    def discovery_received(self, reply_telegram: ReplyTelegram) -> None:
+        """
+        Handle discovery reply parsed by the protocol.
+
+        Args:
+            reply_telegram: The parsed discovery reply telegram.
+        """
+        self.logger.debug("Received discovery response")
+        self.send_blink(reply_telegram.serial_number)
+        self.on_progress.emit(".")
 
     def timeout(self) -> None:
         """Handle timeout event to stop operation."""
@@ -168,7 +177,7 @@ class ConbusBlinkAllService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed with message: {message}")
+        self.logger.debug("Failed with message: %s", message)
         self.service_response.success = False
         self.service_response.timestamp = datetime.now()
         self.service_response.error = message
@@ -190,6 +199,12 @@ class ConbusBlinkAllService:
         if timeout_seconds:
             self.conbus_protocol.timeout_seconds = timeout_seconds
         self.on_or_off = on_or_off
+        # Blink is 05, Unblink is 06; resolved once for every discovered module
+        self.system_function = (
+            SystemFunction.BLINK
+            if on_or_off.lower() == "on"
+            else SystemFunction.UNBLINK
+        )
         # Caller invokes start_reactor()
 
     def set_timeout(self, timeout_seconds: float) -> None:
@@ -216,14 +231,10 @@ class ConbusBlinkAllService:
             Self for context manager protocol.
         """
         # Reset state for singleton reuse
-        self.service_response = ConbusBlinkResponse(
-            success=False,
-            serial_number="",
-            system_function=SystemFunction.NONE,
-            operation="none",
-        )
+        self.service_response = self._new_response()
         self.serial_number = ""
         self.on_or_off = "none"
+        self.system_function = SystemFunction.UNBLINK
         return self
 
     def __exit__(
@@ -234,6 +245,7 @@ class ConbusBlinkAllService:
         self.conbus_protocol.on_connection_made.disconnect(self.connection_made)
         self.conbus_protocol.on_telegram_sent.disconnect(self.telegram_sent)
         self.conbus_protocol.on_telegram_received.disconnect(self.telegram_received)
+        self.conbus_protocol.on_discovery_received.disconnect(self.discovery_received)
         self.conbus_protocol.on_timeout.disconnect(self.timeout)
         self.conbus_protocol.on_failed.disconnect(self.failed)
         # Disconnect service signals
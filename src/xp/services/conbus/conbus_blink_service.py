@@ -15,9 +15,16 @@ from xp.models.conbus.conbus_blink import ConbusBlinkResponse
 from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    ACK_NAK_FUNCTIONS,
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
 from xp.services.telegram.telegram_service import TelegramService
 
+# Requested operation to system function; anything but "on" unblinks
+_ON_OFF_TO_FUNC = {"on": SystemFunction.BLINK, "off": SystemFunction.UNBLINK}
+
 
 class ConbusBlinkService:
     """
@@ -48,12 +55,7 @@ class ConbusBlinkService:
         self.telegram_service = telegram_service
         self.serial_number: str = ""
         self.on_or_off = "none"
-        self.service_response: ConbusBlinkResponse = ConbusBlinkResponse(
-            success=False,
-            serial_number=self.serial_number,
-            system_function=SystemFunction.NONE,
-            operation=self.on_or_off,
-        )
+        self.service_response: ConbusBlinkResponse = self._new_response()
 
         # Set up logging
         self.logger = logging.getLogger(__name__)
@@ -65,13 +67,28 @@ class ConbusBlinkService:
         self.conbus_protocol.on_timeout.connect(self.timeout)
         self.conbus_protocol.on_failed.connect(self.failed)
 
+    @staticmethod
+    def _new_response() -> ConbusBlinkResponse:
+        """
+        Create an empty response for a new blink operation.
+
+        Returns:
+            Unsuccessful response with no system function or operation yet.
+        """
+        return ConbusBlinkResponse(
+            success=False,
+            serial_number="",
+            system_function=SystemFunction.NONE,
+            operation="none",
+        )
+
     def connection_made(self) -> None:
         """Handle connection made event."""
         self.logger.debug("Connection established, sending blink command.")
         # Blink is 05, Unblink is 06
-        system_function = SystemFunction.UNBLINK
-        if self.on_or_off.lower() == "on":
-            system_function = SystemFunction.BLINK
+        system_function = _ON_OFF_TO_FUNC.get(
+            self.on_or_off.lower(), SystemFunction.UNBLINK
+        )
 
         self.conbus_protocol.send_telegram(
             telegram_type=TelegramType.SYSTEM,
@@ -99,14 +116,14 @@ class ConbusBlinkService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if not self.service_response.received_telegrams:
             self.service_response.received_telegrams = []
         self.service_response.received_telegrams.append(telegram_received.frame)
 
         if (
             not telegram_received.checksum_valid
-            or telegram_received.telegram_type != TelegramType.REPLY
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
             or telegram_received.serial_number != self.serial_number
         ):
             self.logger.debug("Not a reply")
@@ -115,9 +132,9 @@ class ConbusBlinkService:
         reply_telegram = self.telegram_service.parse_reply_telegram(
             telegram_received.frame
         )
-        if reply_telegram is not None and reply_telegram.system_function in (
-            SystemFunction.ACK,
-            SystemFunction.NAK,
+        if (
+            reply_telegram is not None
+            and reply_telegram.system_function in ACK_NAK_FUNCTIONS
         ):
             self.logger.debug("Received blink response")
             self.service_response.success = True
@@ -141,7 +158,7 @@ class ConbusBlinkService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed with message: {message}")
+        self.logger.debug("Failed with message: %s", message)
         self.service_response.success = False
         self.service_response.timestamp = datetime.now()
         self.service_response.error = message
@@ -197,12 +214,7 @@ class ConbusBlinkService:
             Self for context manager protocol.
         """
         # Reset state for singleton reuse
-        self.service_response = ConbusBlinkResponse(
-            success=False,
-            serial_number="",
-            system_function=SystemFunction.NONE,
-            operation="none",
-        )
+        self.service_response = self._new_response()
         self.serial_number = ""
         self.on_or_off = "none"
         return self
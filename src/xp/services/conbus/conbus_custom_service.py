@@ -15,7 +15,10 @@ from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
 from xp.models.telegram.reply_telegram import ReplyTelegram
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
 from xp.services.telegram.telegram_service import TelegramService
 
 
@@ -69,11 +72,13 @@ class ConbusCustomService:
     def connection_made(self) -> None:
         """Handle connection established event."""
         self.logger.debug(
-            f"Connection established, sending custom telegram F{self.function_code}D{self.data}."
+            "Connection established, sending custom telegram F%sD%s.",
+            self.function_code,
+            self.data,
         )
         system_function = SystemFunction.from_code(self.function_code)
         if not system_function:
-            self.logger.debug(f"Invalid function code F{self.function_code}")
+            self.logger.debug("Invalid function code F%s", self.function_code)
             self.failed(f"Invalid function code {self.function_code}")
             return
 
@@ -100,14 +105,14 @@ class ConbusCustomService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if not self.service_response.received_telegrams:
             self.service_response.received_telegrams = []
         self.service_response.received_telegrams.append(telegram_received.frame)
 
         if (
             not telegram_received.checksum_valid
-            or telegram_received.telegram_type != TelegramType.REPLY
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
             or telegram_received.serial_number != self.serial_number
         ):
             self.logger.debug("Not a reply for our serial number")
@@ -142,7 +147,7 @@ class ConbusCustomService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed with message: {message}")
+        self.logger.debug("Failed with message: %s", message)
         self.service_response.success = False
         self.service_response.timestamp = datetime.now()
         self.service_response.error = message
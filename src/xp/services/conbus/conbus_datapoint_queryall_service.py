@@ -17,15 +17,18 @@ from xp.models.telegram.reply_telegram import ReplyTelegram
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
 from xp.services import TelegramService
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
 
 
 class ConbusDatapointQueryAllService:
     """
     Utility service for querying all datapoints from a module.
 
-    This service orchestrates multiple ConbusDatapointService calls to query
-    all available datapoint types sequentially.
+    Queues a read for every datapoint type at once; the protocol paces the
+    sends and replies are matched back by their datapoint type.
 
     Attributes:
         conbus_protocol: ConbusEventProtocol for protocol communication.
@@ -64,8 +67,10 @@ class ConbusDatapointQueryAllService:
             success=False,
             serial_number=self.serial_number,
         )
-        self.datapoint_types = list(DataPointType)
-        self.current_index = 0
+        # Datapoint types queried but not answered yet
+        self.pending_datapoints: set[DataPointType] = set()
+        # Queries still waiting in the protocol send queue
+        self.unsent_queries: int = 0
 
         # Set up logging
         self.logger = logging.getLogger(__name__)
@@ -73,46 +78,36 @@ class ConbusDatapointQueryAllService:
     def connection_made(self) -> None:
         """Handle connection established event."""
         self.logger.debug("Connection established, querying datapoints.")
-        self.next_datapoint()
+        self.pending_datapoints = set(DataPointType)
+        self.unsent_queries = len(self.pending_datapoints)
+        for datapoint_type in DataPointType:
+            self.conbus_protocol.send_telegram(
+                telegram_type=TelegramType.SYSTEM,
+                serial_number=self.serial_number,
+                system_function=SystemFunction.READ_DATAPOINT,
+                data_value=str(datapoint_type.value),
+            )
 
-    def next_datapoint(self) -> bool:
-        """
-        Query the next datapoint type.
-
-        Returns:
-            True if there are more datapoints to query, False otherwise.
-        """
-        self.logger.debug("Querying next datapoint")
-
-        if self.current_index >= len(self.datapoint_types):
-            return False
-
-        datapoint_type_code = self.datapoint_types[self.current_index]
-        datapoint_type = DataPointType(datapoint_type_code)
-
-        self.logger.debug(f"Datapoint: {datapoint_type}")
-        self.conbus_protocol.send_telegram(
-            telegram_type=TelegramType.SYSTEM,
-            serial_number=self.serial_number,
-            system_function=SystemFunction.READ_DATAPOINT,
-            data_value=str(datapoint_type.value),
+    def timeout(self) -> None:
+        """Handle timeout event, finishing with the datapoints received."""
+        if self.unsent_queries:
+            # Quiet gap while the protocol paces queued sends; the next send
+            # restarts the inactivity timer
+            return
+        self.logger.debug(
+            "Timeout, %s datapoints unanswered", len(self.pending_datapoints)
         )
-        self.current_index += 1
-        return True
+        self.finish()
 
-    def timeout(self) -> None:
-        """Handle timeout event by querying next datapoint."""
-        self.logger.debug("Timeout, querying next datapoint")
-        query_next_datapoint = self.next_datapoint()
-        if not query_next_datapoint:
-            self.logger.debug("Received all datapoints telegram")
-            self.service_response.success = True
-            self.service_response.timestamp = datetime.now()
-            self.service_response.serial_number = self.serial_number
-            self.service_response.system_function = SystemFunction.READ_DATAPOINT
-
-            # Emit finish signal
-            self.on_finish.emit(self.service_response)
+    def finish(self) -> None:
+        """Finish the query with the datapoints received so far."""
+        self.service_response.success = True
+        self.service_response.timestamp = datetime.now()
+        self.service_response.serial_number = self.serial_number
+        self.service_response.system_function = SystemFunction.READ_DATAPOINT
+
+        # Emit finish signal
+        self.on_finish.emit(self.service_response)
 
     def telegram_sent(self, telegram_sent: str) -> None:
         """
@@ -122,6 +117,8 @@ class ConbusDatapointQueryAllService:
             telegram_sent: The telegram that was sent.
         """
         self.service_response.sent_telegram = telegram_sent
+        if self.unsent_queries:
+            self.unsent_queries -= 1
 
     def telegram_received(self, telegram_received: TelegramReceivedEvent) -> None:
         """
@@ -130,14 +127,14 @@ class ConbusDatapointQueryAllService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if not self.service_response.received_telegrams:
             self.service_response.received_telegrams = []
         self.service_response.received_telegrams.append(telegram_received.frame)
 
         if (
             not telegram_received.checksum_valid
-            or telegram_received.telegram_type != TelegramType.REPLY
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
             or telegram_received.serial_number != self.serial_number
         ):
             self.logger.debug("Not a reply for our serial number")
@@ -157,6 +154,12 @@ class ConbusDatapointQueryAllService:
         self.logger.debug("Received a datapoint telegram")
         self.on_progress.emit(datapoint_telegram)
 
+        if datapoint_telegram.datapoint_type in self.pending_datapoints:
+            self.pending_datapoints.discard(datapoint_telegram.datapoint_type)
+            if not self.pending_datapoints:
+                self.logger.debug("Received all datapoints telegram")
+                self.finish()
+
     def failed(self, message: str) -> None:
         """
         Handle failed connection event.
@@ -164,7 +167,7 @@ class ConbusDatapointQueryAllService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed with message: {message}")
+        self.logger.debug("Failed with message: %s", message)
         self.service_response.success = False
         self.service_response.timestamp = datetime.now()
         self.service_response.error = message
@@ -217,8 +220,8 @@ class ConbusDatapointQueryAllService:
             success=False,
             serial_number="",
         )
-        self.datapoint_types = list(DataPointType)
-        self.current_index = 0
+        self.pending_datapoints = set()
+        self.unsent_queries = 0
         self.serial_number = ""
         return self
 
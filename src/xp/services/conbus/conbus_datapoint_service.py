@@ -16,7 +16,10 @@ from xp.models.telegram.datapoint_type import DataPointType
 from xp.models.telegram.reply_telegram import ReplyTelegram
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
 from xp.services.telegram.telegram_service import TelegramService
 
 
@@ -70,7 +73,7 @@ class ConbusDatapointService:
     def connection_made(self) -> None:
         """Handle connection established event."""
         self.logger.debug(
-            f"Connection established, querying datapoint {self.datapoint_type}."
+            "Connection established, querying datapoint %s.", self.datapoint_type
         )
         if self.datapoint_type is None:
             self.failed("Datapoint type not set")
@@ -99,14 +102,14 @@ class ConbusDatapointService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if not self.service_response.received_telegrams:
             self.service_response.received_telegrams = []
         self.service_response.received_telegrams.append(telegram_received.frame)
 
         if (
             not telegram_received.checksum_valid
-            or telegram_received.telegram_type != TelegramType.REPLY
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
             or telegram_received.serial_number != self.serial_number
         ):
             self.logger.debug("Not a reply for our serial number")
@@ -159,7 +162,7 @@ class ConbusDatapointService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed with message: {message}")
+        self.logger.debug("Failed with message: %s", message)
         self.service_response.success = False
         self.service_response.timestamp = datetime.now()
         self.service_response.serial_number = self.serial_number
@@ -18,7 +18,20 @@ from xp.models.telegram.datapoint_type import DataPointType
 from xp.models.telegram.module_type_code import MODULE_TYPE_REGISTRY
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
+
+# Reply payload R<serial>F<function>D<datacode>: function and datacode markers
+REPLY_CODE = slice(11, 17)
+DISCOVERY_REPLY_CODE = f"F{SystemFunction.DISCOVERY.value}D"
+MODULE_TYPE_CODE_REPLY_CODE = (
+    f"F{SystemFunction.READ_DATAPOINT.value}D{DataPointType.MODULE_TYPE_CODE.value}"
+)
+MODULE_TYPE_REPLY_CODE = (
+    f"F{SystemFunction.READ_DATAPOINT.value}D{DataPointType.MODULE_TYPE.value}"
+)
 
 
 class ConbusDiscoverService:
@@ -76,7 +89,7 @@ class ConbusDiscoverService:
         Args:
             telegram_sent: The telegram that was sent.
         """
-        self.logger.debug(f"Telegram sent: {telegram_sent}")
+        self.logger.debug("Telegram sent: %s", telegram_sent)
         self.discovered_device_result.sent_telegram = telegram_sent
 
     def telegram_received(self, telegram_received: TelegramReceivedEvent) -> None:
@@ -86,41 +99,31 @@ class ConbusDiscoverService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if not self.discovered_device_result.received_telegrams:
             self.discovered_device_result.received_telegrams = []
         self.discovered_device_result.received_telegrams.append(telegram_received.frame)
 
-        # Check for discovery response
-        if (
+        if not (
             telegram_received.checksum_valid
-            and telegram_received.telegram_type == TelegramType.REPLY.value
-            and telegram_received.payload[11:16] == "F01D"
-            and len(telegram_received.payload) == 15
+            and telegram_received.telegram_type == REPLY_TELEGRAM_TYPE
         ):
-            self.handle_discovered_device(telegram_received.serial_number)
+            self.logger.debug("Not a discover or module type response")
+            return
 
-        # Check for module type response (F02D07)
-        elif (
-            telegram_received.checksum_valid
-            and telegram_received.telegram_type == TelegramType.REPLY.value
-            and telegram_received.payload[11:17] == "F02D07"
-            and len(telegram_received.payload) >= 19
-        ):
+        # Function and datacode follow the serial: F<function>D<datacode>
+        payload = telegram_received.payload
+        reply_code = payload[REPLY_CODE]
+        if reply_code == DISCOVERY_REPLY_CODE and len(payload) == 15:
+            self.handle_discovered_device(telegram_received.serial_number)
+        elif reply_code == MODULE_TYPE_CODE_REPLY_CODE and len(payload) >= 19:
             self.handle_module_type_code_response(
-                telegram_received.serial_number, telegram_received.payload[17:19]
+                telegram_received.serial_number, payload[17:19]
             )
-        # Check for module type response (F02D00)
-        elif (
-            telegram_received.checksum_valid
-            and telegram_received.telegram_type == TelegramType.REPLY.value
-            and telegram_received.payload[11:17] == "F02D00"
-            and len(telegram_received.payload) >= 19
-        ):
+        elif reply_code == MODULE_TYPE_REPLY_CODE and len(payload) >= 19:
             self.handle_module_type_response(
-                telegram_received.serial_number, telegram_received.payload[17:19]
+                telegram_received.serial_number, payload[17:19]
             )
-
         else:
             self.logger.debug("Not a discover or module type response")
 
@@ -146,7 +149,7 @@ class ConbusDiscoverService:
         self.on_device_discovered.emit(device)
 
         # Send READ_DATAPOINT telegram to query module type
-        self.logger.debug(f"Sending module type query for {serial_number}")
+        self.logger.debug("Sending module type query for %s", serial_number)
         self.conbus_protocol.send_telegram(
             telegram_type=TelegramType.SYSTEM,
             serial_number=serial_number,
@@ -166,7 +169,7 @@ class ConbusDiscoverService:
             module_type_code: Module type code from telegram (e.g., "07", "24").
         """
         self.logger.info(
-            f"Received module type code {module_type_code} for {serial_number}"
+            "Received module type code %s for %s", module_type_code, serial_number
         )
 
         # Convert module type code to name
@@ -179,17 +182,22 @@ class ConbusDiscoverService:
             if module_info:
                 module_type_name = module_info["name"]
                 self.logger.debug(
-                    f"Module type code {module_type_code} ({code}) = {module_type_name}"
+                    "Module type code %s (%s) = %s",
+                    module_type_code,
+                    code,
+                    module_type_name,
                 )
             else:
                 module_type_name = f"UNKNOWN_{module_type_code}"
                 self.logger.warning(
-                    f"Unknown module type code {module_type_code} ({code})"
+                    "Unknown module type code %s (%s)", module_type_code, code
                 )
 
         except ValueError:
             self.logger.error(
-                f"Invalid module type code format: {module_type_code} for {serial_number}"
+                "Invalid module type code format: %s for %s",
+                module_type_code,
+                serial_number,
             )
             module_type_name = f"INVALID_{module_type_code}"
 
@@ -203,7 +211,9 @@ class ConbusDiscoverService:
                     self.on_device_discovered.emit(device)
 
                     self.logger.debug(
-                        f"Updated device {serial_number} with module_type {module_type_name}"
+                        "Updated device %s with module_type %s",
+                        serial_number,
+                        module_type_name,
                     )
                     break
 
@@ -227,7 +237,7 @@ class ConbusDiscoverService:
             serial_number: Serial number of the device.
             module_type: Module type code from telegram (e.g., "XP33", "XP24").
         """
-        self.logger.info(f"Received module type {module_type} for {serial_number}")
+        self.logger.info("Received module type %s for %s", module_type, serial_number)
 
         # Find and update the device in discovered_devices
         if self.discovered_device_result.discovered_devices:
@@ -235,7 +245,9 @@ class ConbusDiscoverService:
                 if device["serial_number"] == serial_number:
                     device["module_type"] = module_type
                     self.logger.debug(
-                        f"Updated device {serial_number} with module_type {module_type}"
+                        "Updated device %s with module_type %s",
+                        serial_number,
+                        module_type,
                     )
                     self.on_device_discovered.emit(device)
                     break
@@ -262,7 +274,7 @@ class ConbusDiscoverService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed: {message}")
+        self.logger.debug("Failed: %s", message)
         self.discovered_device_result.success = False
         self.discovered_device_result.error = message
         self.on_finish.emit(self.discovered_device_result)
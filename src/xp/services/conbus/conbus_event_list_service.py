@@ -78,7 +78,10 @@ class ConbusEventListService:
                 except ValueError as e:
                     # Invalid action format - log warning and skip
                     self.logger.warning(
-                        f"Invalid action '{action}' in module '{module.serial_number}': {e}"
+                        "Invalid action '%s' in module '%s': %s",
+                        action,
+                        module.serial_number,
+                        e,
                     )
                     continue
 
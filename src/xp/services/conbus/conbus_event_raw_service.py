@@ -64,7 +64,7 @@ class ConbusEventRawService:
     def _send_make_event(self) -> None:
         """Send MAKE event telegram."""
         payload = f"E{self.module_type_code:02d}L{self.link_number:02d}I{self.input_number:02d}M"
-        self.logger.debug(f"Sending MAKE event: {payload}")
+        self.logger.debug("Sending MAKE event: %s", payload)
         self.conbus_protocol.telegram_queue.put_nowait(payload.encode())
         self.conbus_protocol.call_later(0.0, self.conbus_protocol.start_queue_manager)
 
@@ -77,7 +77,7 @@ class ConbusEventRawService:
     def _send_break_event(self) -> None:
         """Send BREAK event telegram."""
         payload = f"E{self.module_type_code:02d}L{self.link_number:02d}I{self.input_number:02d}B"
-        self.logger.debug(f"Sending BREAK event: {payload}")
+        self.logger.debug("Sending BREAK event: %s", payload)
         self.conbus_protocol.telegram_queue.put_nowait(payload.encode())
         self.conbus_protocol.call_later(0.0, self.conbus_protocol.start_queue_manager)
 
@@ -88,7 +88,7 @@ class ConbusEventRawService:
         Args:
             telegram_sent: The telegram that was sent.
         """
-        self.logger.debug(f"Telegram sent: {telegram_sent}")
+        self.logger.debug("Telegram sent: %s", telegram_sent)
         if self.event_result.sent_telegrams is None:
             self.event_result.sent_telegrams = []
         self.event_result.sent_telegrams.append(telegram_sent)
@@ -100,7 +100,7 @@ class ConbusEventRawService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received.frame}")
+        self.logger.debug("Telegram received: %s", telegram_received.frame)
         if self.event_result.received_telegrams is None:
             self.event_result.received_telegrams = []
         self.event_result.received_telegrams.append(telegram_received.frame)
@@ -131,7 +131,7 @@ class ConbusEventRawService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed: {message}")
+        self.logger.debug("Failed: %s", message)
         self.event_result.success = False
         self.event_result.error = message
         if self.finish_callback:
@@ -175,8 +175,11 @@ class ConbusEventRawService:
             timeout_seconds: Timeout in seconds (default: 5).
         """
         self.logger.info(
-            f"Starting event raw: module={module_type_code}, "
-            f"link={link_number}, input={input_number}, time={time_ms}ms"
+            "Starting event raw: module=%s, link=%s, input=%s, time=%sms",
+            module_type_code,
+            link_number,
+            input_number,
+            time_ms,
         )
 
         self.module_type_code = module_type_code
@@ -201,7 +201,7 @@ class ConbusActiontableExportService:
                     # Remove the trailing newline and write
                     f.write(yaml_str.rstrip("\n") + "\n")
 
-            self.logger.info(f"Export written to {path}")
+            self.logger.info("Export written to %s", path)
             self.export_result.output_file = path
 
         except Exception as e:
@@ -228,7 +228,9 @@ class ConbusActiontableExportService:
             return False
 
         self.logger.info(
-            f"Downloading {self.current_module.serial_number} / {self.current_actiontable_type}"
+            "Downloading %s / %s",
+            self.current_module.serial_number,
+            self.current_actiontable_type,
         )
         self.download_service.configure(
             self.current_module.serial_number,
@@ -2,11 +2,13 @@
 
 import asyncio
 import logging
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 import yaml
 from psygnal import Signal
+from twisted.python.failure import Failure
 
 from xp.models.conbus.conbus_export import ConbusExportResponse
 from xp.models.config.conson_module_config import (
@@ -35,14 +37,17 @@ class ConbusExportService:
         device_configs: Device configurations (ConsonModuleConfig instances).
         export_result: Final export result.
         export_status: Export status (OK, FAILED_TIMEOUT, etc.).
-        on_progress: Signal emitted on device discovery (serial, current, total).
+        on_progress: Signal emitted with batches of discovered devices, as a list
+            of (serial, current, total) tuples.
         on_device_exported: Signal emitted when device export completes.
         on_finish: Signal emitted when export finishes.
         DATAPOINT_SEQUENCE: Sequence of 7 datapoints to query for each device.
+        PROGRESS_BATCH_SIZE: Discoveries buffered before progress is emitted.
+        PROGRESS_FLUSH_DELAY: Seconds before a partial progress batch is emitted.
     """
 
     # Signals (class attributes)
-    on_progress: Signal = Signal(str, int, int)  # serial, current, total
+    on_progress: Signal = Signal(list)  # [(serial, current, total), ...]
     on_device_exported: Signal = Signal(ConsonModuleConfig)
     on_finish: Signal = Signal(ConbusExportResponse)
 
@@ -57,6 +62,24 @@ class ConbusExportService:
         DataPointType.AUTO_REPORT_STATUS,
     ]
 
+    # Serial-independent tail of each READ_DATAPOINT query payload ("F02D..")
+    _QUERY_SUFFIXES: ClassVar[tuple[str, ...]] = tuple(
+        f"F{SystemFunction.READ_DATAPOINT.value}D{datapoint.value}"
+        for datapoint in DATAPOINT_SEQUENCE
+    )
+
+    # Progress coalescing for discovery bursts
+    PROGRESS_BATCH_SIZE = 8
+    PROGRESS_FLUSH_DELAY = 0.1
+
+    # Internal fields excluded from the exported module entries
+    _EXPORT_EXCLUDE_FIELDS: ClassVar[set[str]] = {
+        "enabled",
+        "conbus_ip",
+        "conbus_port",
+        "action_table",
+    }
+
     def __init__(
         self, conbus_protocol: ConbusEventProtocol, telegram_service: TelegramService
     ) -> None:
@@ -73,15 +96,25 @@ class ConbusExportService:
 
         # State management
         self.discovered_devices: list[str] = []
+        self._discovered_set: set[str] = set()  # Fast duplicate lookup
+        self._completed_devices: set[str] = set()
+        self._rendered_modules: dict[str, str] = {}  # Completed module YAML
+        self._incomplete_count = 0  # Discovered devices not yet complete
         self.device_configs: dict[str, ConsonModuleConfig] = {}
         self.export_result = ConbusExportResponse(success=False)
         self.export_status = "OK"
         self._finalized = False  # Track if export has been finalized
+        self._progress_batch: list[tuple[str, int, int]] = []
+        self._progress_flush_scheduled = False
 
         # Connect protocol signals
         self.conbus_protocol.on_connection_made.connect(self.connection_made)
         self.conbus_protocol.on_telegram_sent.connect(self.telegram_sent)
         self.conbus_protocol.on_telegram_received.connect(self.telegram_received)
+        self.conbus_protocol.on_discovery_received.connect(self.discovery_received)
+        self.conbus_protocol.on_read_datapoint_received.connect(
+            self.read_datapoint_received
+        )
         self.conbus_protocol.on_timeout.connect(self.timeout)
         self.conbus_protocol.on_failed.connect(self.failed)
 
@@ -108,36 +141,38 @@ class ConbusExportService:
 
     def telegram_received(self, event: TelegramReceivedEvent) -> None:
         """
-        Handle telegram received event.
+        Record received telegram.
+
+        Reply telegrams are parsed once by the protocol and dispatched to
+        discovery_received and read_datapoint_received.
 
         Args:
             event: Telegram received event.
         """
         self.export_result.received_telegrams.append(event.telegram)
 
-        # Only process valid reply telegrams
-        if not event.checksum_valid or event.telegram_type != TelegramType.REPLY.value:
-            return
+    def discovery_received(self, reply_telegram: ReplyTelegram) -> None:
+        """
+        Handle discovery reply (F01D) already parsed by the protocol.
 
-        # Parse telegram using TelegramService
-        try:
-            parsed: ReplyTelegram = self.telegram_service.parse_reply_telegram(
-                event.frame
-            )
-        except Exception as e:
-            self.logger.debug(f"Failed to parse telegram: {e}")
-            return
+        Args:
+            reply_telegram: Parsed discovery reply telegram.
+        """
+        self._handle_discovery_response(reply_telegram.serial_number)
 
-        # Check for discovery response (F01D)
-        if parsed.system_function == SystemFunction.DISCOVERY:
-            self._handle_discovery_response(parsed.serial_number)
+    def read_datapoint_received(self, reply_telegram: ReplyTelegram) -> None:
+        """
+        Handle datapoint reply (F02D) already parsed by the protocol.
 
-        # Check for datapoint response (F02D)
-        elif parsed.system_function == SystemFunction.READ_DATAPOINT:
-            if parsed.datapoint_type and parsed.data_value:
-                self._handle_datapoint_response(
-                    parsed.serial_number, parsed.datapoint_type.value, parsed.data_value
-                )
+        Args:
+            reply_telegram: Parsed datapoint reply telegram.
+        """
+        if reply_telegram.datapoint_type and reply_telegram.data_value:
+            self._handle_datapoint_response(
+                reply_telegram.serial_number,
+                reply_telegram.datapoint_type,
+                reply_telegram.data_value,
+            )
 
     def _handle_discovery_response(self, serial_number: str) -> None:
         """
@@ -146,15 +181,18 @@ class ConbusExportService:
         Args:
             serial_number: Serial number of discovered device.
         """
-        if serial_number in self.discovered_devices:
-            self.logger.debug(f"Ignoring duplicate discovery: {serial_number}")
+        if serial_number in self._discovered_set:
+            self.logger.debug("Ignoring duplicate discovery: %s", serial_number)
             return
 
-        self.logger.debug(f"Device discovered: {serial_number}")
+        self.logger.debug("Device discovered: %s", serial_number)
         self.discovered_devices.append(serial_number)
+        self._discovered_set.add(serial_number)
+        self._incomplete_count += 1
 
-        # Create ConsonModuleConfig with placeholder values for required fields
-        module = ConsonModuleConfig(
+        # Create ConsonModuleConfig with placeholder values for required fields.
+        # Placeholders are known-valid, so skip Pydantic validation.
+        module = ConsonModuleConfig.model_construct(
             name="UNKNOWN",  # Will be updated when link_number arrives
             serial_number=serial_number,
             module_type="UNKNOWN",  # Required field
@@ -163,49 +201,70 @@ class ConbusExportService:
         )
         self.device_configs[serial_number] = module
 
-        # Emit progress signal
+        # Queue progress, emitted in batches
         current = len(self.discovered_devices)
         total = current  # We don't know total until timeout
-        self.on_progress.emit(serial_number, current, total)
+        self._queue_progress(serial_number, current, total)
 
         # Send all datapoint queries immediately (protocol handles throttling)
         self.logger.debug(
-            f"Sending {len(self.DATAPOINT_SEQUENCE)} queries for {serial_number}"
+            "Sending %s queries for %s", len(self.DATAPOINT_SEQUENCE), serial_number
         )
-        for datapoint in self.DATAPOINT_SEQUENCE:
-            self.conbus_protocol.send_telegram(
-                telegram_type=TelegramType.SYSTEM,
-                serial_number=serial_number,
-                system_function=SystemFunction.READ_DATAPOINT,
-                data_value=datapoint.value,
+        prefix = f"{TelegramType.SYSTEM.value}{serial_number}"
+        for suffix in self._QUERY_SUFFIXES:
+            self.conbus_protocol.send_raw_telegram(prefix + suffix)
+
+    def _queue_progress(self, serial_number: str, current: int, total: int) -> None:
+        """
+        Buffer a progress update and emit it with the rest of its burst.
+
+        Args:
+            serial_number: Serial number of discovered device.
+            current: Current device number.
+            total: Total devices discovered.
+        """
+        self._progress_batch.append((serial_number, current, total))
+
+        if len(self._progress_batch) >= self.PROGRESS_BATCH_SIZE:
+            batch, self._progress_batch = self._progress_batch, []
+            self.on_progress.emit(batch)
+        elif not self._progress_flush_scheduled:
+            self._progress_flush_scheduled = True
+            self.conbus_protocol.call_later(
+                self.PROGRESS_FLUSH_DELAY, self._flush_progress
             )
 
+    def _flush_progress(self) -> None:
+        """Emit buffered progress updates as a single batch."""
+        self._progress_flush_scheduled = False
+        if not self._progress_batch:
+            return
+
+        batch, self._progress_batch = self._progress_batch, []
+        self.on_progress.emit(batch)
+
     def _handle_datapoint_response(
-        self, serial_number: str, datapoint_code: str, value: str
+        self, serial_number: str, datapoint: DataPointType, value: str
     ) -> None:
         """
         Handle datapoint response and store value.
 
         Args:
             serial_number: Serial number of device.
-            datapoint_code: Datapoint type code.
+            datapoint: Datapoint type, as already resolved by the reply parser.
             value: Datapoint value.
         """
         if serial_number not in self.device_configs:
             self.logger.warning(
-                f"Received datapoint for unknown device: {serial_number}"
+                "Received datapoint for unknown device: %s", serial_number
             )
             return
 
-        self.logger.debug(f"Datapoint {datapoint_code}={value} for {serial_number}")
+        self.logger.debug("Datapoint %s=%s for %s", datapoint, value, serial_number)
 
         # Store value in device config
-        datapoint = DataPointType.from_code(datapoint_code)
-        if datapoint:
-            self._store_datapoint_value(serial_number, datapoint, value)
-            self._check_device_complete(serial_number)
-        else:
-            self.logger.warning(f"Unknown datapoint code: {datapoint_code}")
+        self._store_datapoint_value(serial_number, datapoint, value)
+        self._check_device_complete(serial_number)
 
     def _store_datapoint_value(
         self, serial_number: str, datapoint: DataPointType, value: str
@@ -238,7 +297,9 @@ class ConbusExportService:
             elif datapoint == DataPointType.AUTO_REPORT_STATUS:
                 module.auto_report_status = value
         except (ValueError, TypeError) as e:
-            self.logger.warning(f"Invalid value '{value}' for {datapoint.name}: {e}")
+            self.logger.warning(
+                "Invalid value '%s' for %s: %s", value, datapoint.name, e
+            )
 
     def _is_device_complete(self, serial_number: str) -> bool:
         """
@@ -270,13 +331,22 @@ class ConbusExportService:
         Args:
             serial_number: Serial number of device.
         """
+        if serial_number in self._completed_devices:
+            # Late datapoint changed a rendered module, render again at finalize
+            self._rendered_modules.pop(serial_number, None)
+            return
+
         if self._is_device_complete(serial_number):
-            self.logger.debug(f"Device {serial_number} complete (7/7 datapoints)")
+            self.logger.debug("Device %s complete (7/7 datapoints)", serial_number)
+            self._completed_devices.add(serial_number)
+            self._incomplete_count -= 1
             module = self.device_configs[serial_number]
+            # Serialize while discovery continues, finalize only joins
+            self._rendered_modules[serial_number] = self._render_module(module)
             self.on_device_exported.emit(module)
 
             # Check if all devices complete
-            if all(self._is_device_complete(sn) for sn in self.discovered_devices):
+            if self._incomplete_count == 0:
                 self.logger.debug("All devices complete")
                 self._finalize_export()
 
@@ -288,6 +358,7 @@ class ConbusExportService:
 
         self._finalized = True
         self.logger.info("Finalizing export")
+        self._flush_progress()
 
         if not self.discovered_devices:
             self.export_status = "FAILED_NO_DEVICES"
@@ -297,102 +368,136 @@ class ConbusExportService:
             self.on_finish.emit(self.export_result)
             return
 
-        # Convert dict values to list (already ConsonModuleConfig instances!)
-        modules = list(self.device_configs.values())
+        # Sort modules by link_number straight from the dict values view
+        # (already ConsonModuleConfig instances, no intermediate copy).
+        # link_number is a required int, discovery sets a 0 placeholder.
+        modules = sorted(self.device_configs.values(), key=attrgetter("link_number"))
 
-        # Sort modules by link_number
-        modules.sort(key=lambda m: m.link_number if m.link_number is not None else 999)
-
-        # Create ConsonModuleListConfig
+        # Create ConsonModuleListConfig from the already-built module instances
         try:
-            module_list = ConsonModuleListConfig(root=modules)
+            module_list = ConsonModuleListConfig.model_construct(root=modules)
             self.export_result.config = module_list
             self.export_result.device_count = len(modules)
+            content = self._render_export(module_list)
+        except Exception as e:
+            self.logger.error("Failed to create export: %s", e)
+            self._fail_write(str(e))
+            return
 
-            # Write to file
-            self._write_export_file("export.yml")
+        # Write to file off the reactor thread, finish once it is written
+        deferred = self.conbus_protocol.defer_to_thread(
+            self._write_export_file, "export.yml", content
+        )
+        deferred.addCallbacks(self._export_written, self._export_write_failed)
 
-            self.export_result.success = True
-            self.export_result.export_status = self.export_status
-            self.on_finish.emit(self.export_result)
+    def _render_export(self, module_list: ConsonModuleListConfig) -> str:
+        """
+        Render export modules to YAML.
 
-        except Exception as e:
-            self.logger.error(f"Failed to create export: {e}")
-            self.export_status = "FAILED_WRITE"
-            self.export_result.success = False
-            self.export_result.error = str(e)
-            self.export_result.export_status = self.export_status
-            self.on_finish.emit(self.export_result)
+        Modules rendered on completion are reused, only incomplete ones are
+        serialized here.
+
+        Args:
+            module_list: Modules to export.
+
+        Returns:
+            YAML document with one list entry per module, separated by blank lines.
+        """
+        yaml_modules = [
+            self._rendered_modules.get(module.serial_number)
+            or self._render_module(module)
+            for module in module_list.root
+        ]
+
+        # Blank line between modules
+        return "\n".join(yaml_modules)
+
+    def _render_module(self, module: ConsonModuleConfig) -> str:
+        """
+        Render a single module as a YAML list entry.
+
+        Args:
+            module: Module to render.
+
+        Returns:
+            YAML list entry ending with a single newline.
+        """
+        # Dump module directly, excluding only internal fields
+        data = module.model_dump(exclude=self._EXPORT_EXCLUDE_FIELDS, exclude_none=True)
+        # Dump single item as list element
+        yaml_str: str = yaml.safe_dump(
+            [data],
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+        # Remove the trailing newline
+        return yaml_str.rstrip("\n") + "\n"
 
-    def _write_export_file(self, path: str) -> None:
+    @staticmethod
+    def _write_export_file(path: str, content: str) -> str:
         """
-        Write export to YAML file.
+        Write rendered export to file.
+
+        Runs in the reactor thread pool, so it must not touch service state.
 
         Args:
             path: Output file path.
+            content: Rendered YAML content.
 
-        Raises:
-            Exception: If file write fails.
+        Returns:
+            The path written to.
         """
-        try:
-            output_path = Path(path)
-
-            if self.export_result.config:
-                # Use Pydantic's model_dump to serialize, excluding only internal fields
-                data = self.export_result.config.model_dump(
-                    exclude={
-                        "root": {
-                            "__all__": {
-                                "enabled",
-                                "conbus_ip",
-                                "conbus_port",
-                                "action_table",
-                            }
-                        }
-                    },
-                    exclude_none=True,
-                )
-
-                # Export as list at root level (not wrapped in 'root:' key)
-                modules_list = data.get("root", [])
-
-                with output_path.open("w") as f:
-                    # Dump each module separately with blank lines between them
-                    for i, module in enumerate(modules_list):
-                        # Add blank line before each module except the first
-                        if i > 0:
-                            f.write("\n")
-
-                        # Dump single item as list element
-                        yaml_str = yaml.safe_dump(
-                            [module],
-                            default_flow_style=False,
-                            sort_keys=False,
-                            allow_unicode=True,
-                        )
-                        # Remove the trailing newline and write
-                        f.write(yaml_str.rstrip("\n") + "\n")
-
-            self.logger.info(f"Export written to {path}")
-            self.export_result.output_file = path
+        with Path(path).open("w") as f:
+            f.write(content)
+        return path
 
-        except Exception as e:
-            self.logger.error(f"Failed to write export file: {e}")
-            self.export_status = "FAILED_WRITE"
-            raise
+    def _export_written(self, path: str) -> None:
+        """
+        Handle export file written.
+
+        Args:
+            path: Output file path.
+        """
+        self.logger.info("Export written to %s", path)
+        self.export_result.output_file = path
+        self.export_result.success = True
+        self.export_result.export_status = self.export_status
+        self.on_finish.emit(self.export_result)
+
+    def _export_write_failed(self, failure: Failure) -> None:
+        """
+        Handle export file write failure.
+
+        Args:
+            failure: Failure raised by the file write.
+        """
+        self.logger.error("Failed to write export file: %s", failure.value)
+        self._fail_write(str(failure.value))
+
+    def _fail_write(self, error: str) -> None:
+        """
+        Finish the export as failed to write.
+
+        Args:
+            error: Error message.
+        """
+        self.export_status = "FAILED_WRITE"
+        self.export_result.success = False
+        self.export_result.error = error
+        self.export_result.export_status = self.export_status
+        self.on_finish.emit(self.export_result)
 
     def timeout(self) -> None:
         """Handle timeout event."""
         timeout = self.conbus_protocol.timeout_seconds
-        self.logger.info(f"Export timeout after {timeout}s")
+        self.logger.info("Export timeout after %ss", timeout)
 
         # Check if any devices incomplete
-        incomplete = [
-            sn for sn in self.discovered_devices if not self._is_device_complete(sn)
-        ]
-
-        if incomplete:
-            self.logger.warning(f"Partial export: {len(incomplete)} incomplete devices")
+        if self._incomplete_count > 0:
+            self.logger.warning(
+                "Partial export: %s incomplete devices", self._incomplete_count
+            )
             self.export_status = "FAILED_TIMEOUT"
 
         self._finalize_export()
@@ -404,7 +509,7 @@ class ConbusExportService:
         Args:
             message: Failure message.
         """
-        self.logger.error(f"Connection failed: {message}")
+        self.logger.error("Connection failed: %s", message)
         self.export_status = "FAILED_CONNECTION"
         self.export_result.success = False
         self.export_result.error = message
@@ -418,7 +523,7 @@ class ConbusExportService:
         Args:
             timeout_seconds: Timeout in seconds.
         """
-        self.logger.debug(f"Set timeout: {timeout_seconds}s")
+        self.logger.debug("Set timeout: %ss", timeout_seconds)
         self.conbus_protocol.timeout_seconds = timeout_seconds
 
     def set_event_loop(self, event_loop: asyncio.AbstractEventLoop) -> None:
@@ -448,10 +553,16 @@ class ConbusExportService:
         """
         # Reset state for reuse
         self.discovered_devices = []
+        self._discovered_set = set()
+        self._completed_devices = set()
+        self._rendered_modules = {}
+        self._incomplete_count = 0
         self.device_configs = {}
         self.export_result = ConbusExportResponse(success=False)
         self.export_status = "OK"
         self._finalized = False
+        self._progress_batch = []
+        self._progress_flush_scheduled = False
         return self
 
     def __exit__(
@@ -461,6 +572,10 @@ class ConbusExportService:
         self.conbus_protocol.on_connection_made.disconnect(self.connection_made)
         self.conbus_protocol.on_telegram_sent.disconnect(self.telegram_sent)
         self.conbus_protocol.on_telegram_received.disconnect(self.telegram_received)
+        self.conbus_protocol.on_discovery_received.disconnect(self.discovery_received)
+        self.conbus_protocol.on_read_datapoint_received.disconnect(
+            self.read_datapoint_received
+        )
         self.conbus_protocol.on_timeout.disconnect(self.timeout)
         self.conbus_protocol.on_failed.disconnect(self.failed)
         self.on_progress.disconnect()
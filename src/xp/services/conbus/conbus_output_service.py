@@ -17,7 +17,11 @@ from xp.models.telegram.action_type import ActionType
 from xp.models.telegram.output_telegram import OutputTelegram
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    ACK_NAK_FUNCTIONS,
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
 from xp.services.telegram.telegram_output_service import (
     TelegramOutputService,
     XPOutputError,
@@ -86,7 +90,9 @@ class ConbusOutputService:
     def connection_made(self) -> None:
         """Handle connection established event."""
         self.logger.debug(
-            f"Connection established, sending action {self.action_type} to output {self.output_number}."
+            "Connection established, sending action %s to output %s.",
+            self.action_type,
+            self.output_number,
         )
 
         # Validate parameters before sending
@@ -122,7 +128,7 @@ class ConbusOutputService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
 
         if not self.service_response.received_telegrams:
             self.service_response.received_telegrams = []
@@ -130,7 +136,7 @@ class ConbusOutputService:
 
         if (
             not telegram_received.checksum_valid
-            or telegram_received.telegram_type != TelegramType.REPLY
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
             or telegram_received.serial_number != self.serial_number
         ):
             self.logger.debug("Not a reply for our serial number")
@@ -141,15 +147,12 @@ class ConbusOutputService:
             telegram_received.frame
         )
 
-        if output_telegram and output_telegram.system_function in (
-            SystemFunction.ACK,
-            SystemFunction.NAK,
-        ):
-            self.logger.debug(f"Received {output_telegram.system_function} response")
+        if output_telegram and output_telegram.system_function in ACK_NAK_FUNCTIONS:
+            self.logger.debug("Received %s response", output_telegram.system_function)
             self.succeed(output_telegram)
         else:
             self.logger.debug(
-                f"Unexpected system function: {output_telegram.system_function}"
+                "Unexpected system function: %s", output_telegram.system_function
             )
 
     def succeed(self, output_telegram: OutputTelegram) -> None:
@@ -180,7 +183,7 @@ class ConbusOutputService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed with message: {message}")
+        self.logger.debug("Failed with message: %s", message)
         self.service_response.success = False
         self.service_response.timestamp = datetime.now()
         self.service_response.serial_number = self.serial_number
@@ -61,7 +61,7 @@ class ConbusRawService:
     def connection_made(self) -> None:
         """Handle connection established event."""
         self.logger.debug(
-            f"Connection established, sending {len(self.telegrams)} telegrams"
+            "Connection established, sending %s telegrams", len(self.telegrams)
         )
         for telegram in self.telegrams:
             self.conbus_protocol.send_raw_telegram(telegram)
@@ -85,7 +85,7 @@ class ConbusRawService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if not self.service_response.received_telegrams:
             self.service_response.received_telegrams = []
         self.service_response.received_telegrams.append(telegram_received.frame)
@@ -95,7 +95,7 @@ class ConbusRawService:
     def timeout(self) -> None:
         """Handle timeout event."""
         timeout_seconds = self.conbus_protocol.timeout_seconds
-        self.logger.debug(f"Timeout: {timeout_seconds}s")
+        self.logger.debug("Timeout: %ss", timeout_seconds)
         self.on_finish.emit(self.service_response)
 
     def failed(self, message: str) -> None:
@@ -105,7 +105,7 @@ class ConbusRawService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed with message: {message}")
+        self.logger.debug("Failed with message: %s", message)
         self.service_response.success = False
         self.service_response.timestamp = datetime.now()
         self.service_response.error = message
@@ -123,7 +123,9 @@ class ConbusRawService:
             telegrams: List of raw telegram strings to send.
             timeout_seconds: Timeout in seconds.
         """
-        self.logger.info(f"Starting send_raw_telegrams with {len(telegrams)} telegrams")
+        self.logger.info(
+            "Starting send_raw_telegrams with %s telegrams", len(telegrams)
+        )
         if timeout_seconds:
             self.conbus_protocol.timeout_seconds = timeout_seconds
         self.telegrams = telegrams
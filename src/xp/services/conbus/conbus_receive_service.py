@@ -74,7 +74,7 @@ class ConbusReceiveService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         self.on_progress.emit(telegram_received.frame)
 
         if not self.receive_response.received_telegrams:
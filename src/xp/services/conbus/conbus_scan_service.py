@@ -13,7 +13,16 @@ from psygnal import Signal
 
 from xp.models import ConbusResponse
 from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.models.telegram.system_function import SystemFunction
+from xp.services.protocol.conbus_event_protocol import (
+    REPLY_FUNCTION_CODE,
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
+
+# Reply payload R<serial>F<function>D<datacode>: the datacode follows "D" at 14
+REPLY_DATACODE = slice(15, 17)
+ACK_NAK_CODES = frozenset({SystemFunction.ACK.value, SystemFunction.NAK.value})
 
 
 class ConbusScanService:
@@ -52,6 +61,12 @@ class ConbusScanService:
         self.serial_number: str = ""
         self.function_code: str = ""
         self.datapoint_value: int = -1
+        # Two-digit datacode of the telegram currently being scanned
+        self.datacode: str = ""
+        # True while the current datacode has not been answered yet
+        self.awaiting_reply: bool = False
+        # False after a timeout advance: a late ACK/NAK may answer the previous code
+        self.accept_ack_nak: bool = True
         self.service_response: ConbusResponse = ConbusResponse(
             success=False,
             serial_number=self.serial_number,
@@ -79,10 +94,11 @@ class ConbusScanService:
             self.on_finish.emit(self.service_response)
             return False
 
-        self.logger.debug(f"Scanning next datacode: {self.datapoint_value:02d}")
-        data = f"{self.datapoint_value:02d}"
-        telegram_body = f"S{self.serial_number}F{self.function_code}D{data}"
+        self.datacode = f"{self.datapoint_value:02d}"
+        self.logger.debug("Scanning next datacode: %s", self.datacode)
+        telegram_body = f"S{self.serial_number}F{self.function_code}D{self.datacode}"
         self.conbus_protocol.sendFrame(telegram_body.encode())
+        self.awaiting_reply = True
         return True
 
     def telegram_sent(self, telegram_sent: str) -> None:
@@ -102,17 +118,50 @@ class ConbusScanService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
         if not self.service_response.received_telegrams:
             self.service_response.received_telegrams = []
         self.service_response.received_telegrams.append(telegram_received.frame)
 
         self.on_progress.emit(telegram_received.frame)
 
+        # Move on as soon as the module answers instead of waiting for timeout
+        if self.awaiting_reply and self._answers_current_datacode(telegram_received):
+            self.awaiting_reply = False
+            self.accept_ack_nak = True
+            self.scan_next_datacode()
+
+    def _answers_current_datacode(
+        self, telegram_received: TelegramReceivedEvent
+    ) -> bool:
+        """
+        Check whether a telegram is the module's reply to the current datacode.
+
+        Args:
+            telegram_received: The telegram received event.
+
+        Returns:
+            True for a valid reply from the scanned module that echoes the
+            current datacode, or acknowledges / rejects it. ACK/NAK replies
+            carry no datacode, so they are not accepted after a timeout
+            advance, where they may still answer the previous datacode.
+        """
+        if (
+            not telegram_received.checksum_valid
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
+            or telegram_received.serial_number != self.serial_number
+        ):
+            return False
+        payload = telegram_received.payload
+        if payload[REPLY_FUNCTION_CODE] in ACK_NAK_CODES:
+            return self.accept_ack_nak
+        return payload[REPLY_DATACODE] == self.datacode
+
     def timeout(self) -> None:
         """Handle timeout event by scanning next data code."""
-        timeout_seconds = self.conbus_protocol.timeout_seconds
-        self.logger.debug(f"Timeout: {timeout_seconds}s")
+        self.logger.debug("Timeout: %ss", self.conbus_protocol.timeout_seconds)
+        self.awaiting_reply = False
+        self.accept_ack_nak = False
         self.scan_next_datacode()
 
     def failed(self, message: str) -> None:
@@ -122,7 +171,7 @@ class ConbusScanService:
         Args:
             message: Failure message.
         """
-        self.logger.debug(f"Failed with message: {message}")
+        self.logger.debug("Failed with message: %s", message)
         self.service_response.success = False
         self.service_response.timestamp = datetime.now()
         self.service_response.error = message
@@ -176,6 +225,9 @@ class ConbusScanService:
         self.serial_number = ""
         self.function_code = ""
         self.datapoint_value = -1
+        self.datacode = ""
+        self.awaiting_reply = False
+        self.accept_ack_nak = True
         self.service_response = ConbusResponse(
             success=False,
             serial_number="",
@@ -15,7 +15,11 @@ from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
 from xp.models.telegram.datapoint_type import DataPointType
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
-from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.protocol.conbus_event_protocol import (
+    ACK_NAK_FUNCTIONS,
+    REPLY_TELEGRAM_TYPE,
+    ConbusEventProtocol,
+)
 from xp.services.telegram.telegram_service import TelegramService
 
 
@@ -70,7 +74,7 @@ class WriteConfigService:
 
     def connection_made(self) -> None:
         """Handle connection made event."""
-        self.logger.debug(f"Connection established, writing config {self.data_value}.")
+        self.logger.debug("Connection established, writing config %s.", self.data_value)
 
         # Validate parameters before sending
         if not self.serial_number or len(self.serial_number) != 10:
@@ -112,7 +116,7 @@ class WriteConfigService:
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Telegram received: {telegram_received}")
+        self.logger.debug("Telegram received: %s", telegram_received)
 
         if not self.write_config_response.received_telegrams:
             self.write_config_response.received_telegrams = []
@@ -120,7 +124,7 @@ class WriteConfigService:
 
         if (
             not telegram_received.checksum_valid
-            or telegram_received.telegram_type != TelegramType.REPLY
+            or telegram_received.telegram_type != REPLY_TELEGRAM_TYPE
             or telegram_received.serial_number != self.serial_number
         ):
             self.logger.debug("Not a reply for our serial number")
@@ -131,9 +135,9 @@ class WriteConfigService:
             telegram_received.frame
         )
 
-        if not reply_telegram or reply_telegram.system_function not in (
-            SystemFunction.ACK,
-            SystemFunction.NAK,
+        if (
+            not reply_telegram
+            or reply_telegram.system_function not in ACK_NAK_FUNCTIONS
         ):
             self.logger.debug("Not a write config reply")
             return
@@ -9,12 +9,18 @@ import logging
 from queue import SimpleQueue
 from random import randint
 from threading import Lock
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, cast
 
 from psygnal import Signal
-from twisted.internet import protocol
+from twisted.internet import protocol, threads
 from twisted.internet.base import DelayedCall
-from twisted.internet.interfaces import IAddress, IConnector
+from twisted.internet.defer import Deferred
+from twisted.internet.interfaces import (
+    IAddress,
+    IConnector,
+    IReactorFromThreads,
+    ITCPTransport,
+)
 from twisted.internet.posixbase import PosixReactorBase
 from twisted.python.failure import Failure
 
@@ -32,6 +38,10 @@ from xp.utils import calculate_checksum
 # Constants
 NO_ERROR_CODE = "00"
 CHUNK_HEADER_LENGTH = 2  # data_value format: 2-char counter + actiontable chunk
+REPLY_TELEGRAM_TYPE = TelegramType.REPLY.value  # "R"
+ACK_NAK_FUNCTIONS = frozenset({SystemFunction.ACK, SystemFunction.NAK})
+# Reply payload layout: R + 10-digit serial + F + 2-digit system function
+REPLY_FUNCTION_CODE = slice(12, 14)
 
 
 class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
@@ -58,6 +68,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         on_telegram_received: Signal emitted when a telegram is received.
         on_invalid_telegram_received: Signal emitted when invalid telegram received.
         on_read_datapoint_received: Signal emitted when read datapoint reply received.
+        on_discovery_received: Signal emitted when discovery reply received.
         on_actiontable_chunk_received: Signal emitted when actiontable chunk received.
         on_eof_received: Signal emitted when EOF telegram received.
         on_timeout: Signal emitted when timeout occurs.
@@ -66,7 +77,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         on_stop_reactor: Signal emitted when reactor stops.
     """
 
-    buffer: bytes
+    buffer: bytearray
 
     telegram_queue: SimpleQueue[bytes] = SimpleQueue()  # FIFO
     queue_manager_running: bool = False
@@ -83,6 +94,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
     on_telegram_received: Signal = Signal(TelegramReceivedEvent)
     on_invalid_telegram_received: Signal = Signal(TelegramReceivedEvent)
     on_read_datapoint_received: Signal = Signal(ReplyTelegram)
+    on_discovery_received: Signal = Signal(ReplyTelegram)
     on_actiontable_chunk_received: Signal = Signal(ReplyTelegram, str)
     on_eof_received: Signal = Signal(ReplyTelegram)
 
@@ -105,7 +117,8 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
             reactor: Twisted reactor for event handling.
             telegram_service: Telegram service for parsing telegrams.
         """
-        self.buffer = b""
+        # Received bytes not yet framed; consumed frames are trimmed in place
+        self.buffer = bytearray()
         self.logger = logging.getLogger(__name__)
         self.cli_config = cli_config.conbus
         self._reactor = reactor
@@ -113,6 +126,15 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         self.timeout_call: Optional[DelayedCall] = None
         self.telegram_service = telegram_service
 
+        # Reply dispatch by system function
+        # Keyed by function code so replies can be skipped before parsing
+        self._reply_handlers: dict[str, Callable[[ReplyTelegram], Any]] = {
+            SystemFunction.READ_DATAPOINT.value: self.on_read_datapoint_received.emit,
+            SystemFunction.DISCOVERY.value: self.on_discovery_received.emit,
+            SystemFunction.ACTIONTABLE.value: self._emit_actiontable_chunk,
+            SystemFunction.EOF.value: self.on_eof_received.emit,
+        }
+
     def connectionMade(self) -> None:
         """
         Handle connection established event.
@@ -121,6 +143,11 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         timeout monitoring.
         """
         self.logger.debug("connectionMade")
+        # Telegrams are a few dozen bytes; send each one without Nagle delay,
+        # and let the kernel detect a gateway that vanished on an idle session
+        if ITCPTransport.providedBy(self.transport):
+            self.transport.setTcpNoDelay(True)  # type: ignore[union-attr]
+            self.transport.setTcpKeepAlive(True)  # type: ignore[union-attr]
         self.on_connection_made.emit()
 
         # Start inactivity timeout
@@ -162,25 +189,28 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
             # <S0123450001F02D12FK>
             # <R0123450001F02D12FK>
             # <E12L01I08MAK>
-            frame = self.buffer[start : end + 1]  # <S0123450001F02D12FK>
-            self.buffer = self.buffer[end + 1 :]
+            # Decode the frame once, every field is a slice of its text
+            frame = self.buffer[start : end + 1].decode("latin-1")
+            del self.buffer[: end + 1]
             telegram = frame[1:-1]  # S0123450001F02D12FK
-            telegram_type = telegram[0:1].decode()  # S
-            payload = telegram[:-2]  # S0123450001F02D12
-            checksum = telegram[-2:].decode()  # FK
+            telegram_type = telegram[0:1]  # S
+            payload_text = telegram[:-2]  # S0123450001F02D12
+            checksum = telegram[-2:]  # FK
             serial_number = (
-                telegram[1:11].decode("latin-1") if telegram_type in ("S", "R") else ""
+                telegram[1:11] if telegram_type in ("S", "R") else ""
             )  # 0123450001
-            calculated_checksum = calculate_checksum(payload.decode(encoding="latin-1"))
+            calculated_checksum = calculate_checksum(payload_text)
 
             checksum_valid = checksum == calculated_checksum
             if not checksum_valid:
                 self.logger.debug(
-                    f"Invalid checksum: {checksum}, calculated: {calculated_checksum}"
+                    "Invalid checksum: %s, calculated: %s",
+                    checksum,
+                    calculated_checksum,
                 )
 
             self.logger.debug(
-                f"frameReceived payload: {payload.decode('latin-1')}, checksum: {checksum}"
+                "frameReceived payload: %s, checksum: %s", payload_text, checksum
             )
 
             # Reset timeout on activity
@@ -188,9 +218,9 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
 
             telegram_received = TelegramReceivedEvent(
                 protocol=self,
-                frame=frame.decode("latin-1"),
-                telegram=telegram.decode("latin-1"),
-                payload=payload.decode("latin-1"),
+                frame=frame,
+                telegram=telegram,
+                payload=payload_text,
                 telegram_type=telegram_type,
                 serial_number=serial_number,
                 checksum=checksum,
@@ -205,7 +235,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         Args:
             telegram_received: The telegram received event.
         """
-        self.logger.debug(f"Received {telegram_received}")
+        self.logger.debug("Received %s", telegram_received)
         self.on_telegram_received.emit(telegram_received)
 
         # Filter invalid telegrams
@@ -214,29 +244,33 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
             self.on_invalid_telegram_received.emit(telegram_received)
             return
 
-        if telegram_received.telegram_type != TelegramType.REPLY.value:
+        if telegram_received.telegram_type != REPLY_TELEGRAM_TYPE:
             self.logger.debug(
-                f"Filtered: not a reply (got {telegram_received.telegram_type})"
+                "Filtered: not a reply (got %s)", telegram_received.telegram_type
             )
             self.on_invalid_telegram_received.emit(telegram_received)
             return
 
+        handler = self._reply_handlers.get(
+            telegram_received.payload[REPLY_FUNCTION_CODE]
+        )
+        if handler is None:
+            return
+
         reply_telegram = self.telegram_service.parse_reply_telegram(
             telegram_received.frame
         )
+        handler(reply_telegram)
 
-        if reply_telegram.system_function == SystemFunction.READ_DATAPOINT:
-            self.on_read_datapoint_received.emit(reply_telegram)
-            return
-
-        if reply_telegram.system_function == SystemFunction.ACTIONTABLE:
-            actiontable_chunk = reply_telegram.data_value[CHUNK_HEADER_LENGTH:]
-            self.on_actiontable_chunk_received.emit(reply_telegram, actiontable_chunk)
-            return
+    def _emit_actiontable_chunk(self, reply_telegram: ReplyTelegram) -> None:
+        """
+        Emit actiontable chunk with the counter header stripped.
 
-        if reply_telegram.system_function == SystemFunction.EOF:
-            self.on_eof_received.emit(reply_telegram)
-            return
+        Args:
+            reply_telegram: The parsed actiontable reply telegram.
+        """
+        actiontable_chunk = reply_telegram.data_value[CHUNK_HEADER_LENGTH:]
+        self.on_actiontable_chunk_received.emit(reply_telegram, actiontable_chunk)
 
     def sendFrame(self, data: bytes) -> None:
         """
@@ -247,19 +281,18 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         """
         self.on_send_frame.emit(data)
 
-        # Calculate full frame (add checksum and brackets)
-        checksum = calculate_checksum(data.decode())
-        frame_data = data.decode() + checksum
-        frame = b"<" + frame_data.encode() + b">"
+        # Calculate full frame (add checksum and brackets), encoding it once
+        payload = data.decode()
+        frame_text = f"<{payload}{calculate_checksum(payload)}>"
 
         if not self.transport:
             self.logger.info("Invalid transport, connection closed.")
             self.on_connection_failed.emit(Failure("Invalid transport."))
             return
 
-        self.logger.debug(f"Sending frame: {frame.decode()}")
-        self.transport.write(frame)  # type: ignore
-        self.on_telegram_sent.emit(frame.decode())
+        self.logger.debug("Sending frame: %s", frame_text)
+        self.transport.write(frame_text.encode())  # type: ignore
+        self.on_telegram_sent.emit(frame_text)
         self._reset_timeout()
 
     def send_telegram(
@@ -310,7 +343,9 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
             payload: Telegram to send.
         """
         self.telegram_queue.put_nowait(payload.encode())
-        self.call_later(0.0, self.start_queue_manager)
+        # A running queue manager drains the queue, only wake it when idle
+        if not self.queue_manager_running:
+            self.call_later(0.0, self.start_queue_manager)
 
     def send_error_status_query(self, serial_number: str) -> None:
         """
@@ -378,6 +413,31 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         """
         return self._reactor.callLater(delay, callable_action, *args, **kw)
 
+    def defer_to_thread(
+        self,
+        callable_action: Callable[..., Any],
+        *args: object,
+        **kw: object,
+    ) -> Deferred:
+        """
+        Run a blocking callable in the reactor thread pool.
+
+        Args:
+            callable_action: The blocking callable to execute.
+            args: Positional arguments to pass to callable.
+            kw: Keyword arguments to pass to callable.
+
+        Returns:
+            Deferred firing on the reactor thread with the callable result.
+        """
+        return threads.deferToThreadPool(
+            cast(IReactorFromThreads, self._reactor),
+            self._reactor.getThreadPool(),
+            callable_action,
+            *args,
+            **kw,
+        )
+
     def buildProtocol(self, addr: Optional[IAddress]) -> protocol.Protocol:
         """
         Build protocol instance for connection.
@@ -388,7 +448,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         Returns:
             Protocol instance for this connection.
         """
-        self.logger.debug(f"buildProtocol: {addr}")
+        self.logger.debug("buildProtocol: %s", addr)
         return self
 
     def clientConnectionFailed(self, _connector: IConnector, reason: Failure) -> None:
@@ -399,7 +459,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
             _connector: Connection connector instance (unused, required by Twisted).
             reason: Failure reason details.
         """
-        self.logger.debug(f"clientConnectionFailed: {reason}")
+        self.logger.debug("clientConnectionFailed: %s", reason)
         self.on_client_connection_failed.emit(reason)
         self.connection_failed(reason)
         self._cancel_timeout()
@@ -412,7 +472,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
             _connector: Connection connector instance (unused, required by Twisted).
             reason: Reason for connection loss.
         """
-        self.logger.debug(f"clientConnectionLost: {reason}")
+        self.logger.debug("clientConnectionLost: %s", reason)
         self.on_connection_lost.emit(reason)
         self._cancel_timeout()
 
@@ -428,7 +488,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         Args:
             reason: Failure reason details.
         """
-        self.logger.debug(f"Client connection failed: {reason}")
+        self.logger.debug("Client connection failed: %s", reason)
         self.on_connection_failed.emit(reason)
         self.on_failed.emit(reason.getErrorMessage())
 
@@ -445,7 +505,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
     def _on_timeout(self) -> None:
         """Handle inactivity timeout expiration."""
         self.timeout()
-        self.logger.debug(f"Conbus timeout after {self.timeout_seconds} seconds")
+        self.logger.debug("Conbus timeout after %s seconds", self.timeout_seconds)
 
     def stop_reactor(self) -> None:
         """Stop the reactor if it's running."""
@@ -455,7 +515,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
                 self._reactor.stop()
         except Exception as e:
             # Reactor might have already stopped or not been started via run()
-            self.logger.debug(f"Reactor stop failed (likely already stopped): {e}")
+            self.logger.debug("Reactor stop failed (likely already stopped): %s", e)
 
     def connect(self) -> None:
         """
@@ -470,7 +530,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
         # Auto-detect and integrate with asyncio event loop if available
         try:
             event_loop = asyncio.get_running_loop()
-            self.logger.debug(f"Detected running event loop: {event_loop}")
+            self.logger.debug("Detected running event loop: %s", event_loop)
             self.set_event_loop(event_loop)
         except RuntimeError:
             # No running event loop - that's fine for non-async contexts
@@ -502,7 +562,7 @@ class ConbusEventProtocol(protocol.Protocol, protocol.ClientFactory):
     def process_telegram_queue(self) -> None:
         """Start the queue manager if it's not running."""
         self.logger.debug(
-            f"Queue manager: processing (remaining: {self.telegram_queue.qsize()})"
+            "Queue manager: processing (remaining: %s)", self.telegram_queue.qsize()
         )
         if self.telegram_queue.empty():
             with self.queue_manager_lock:
@@ -15,6 +15,9 @@ from typing import Dict, Optional
 from xp.models import ConbusClientConfig
 from xp.models.response import Response
 
+# Size of the receive buffer reused for each relay direction
+RELAY_BUFFER_SIZE = 65536
+
 
 class ReverseProxyError(Exception):
     """Raised when Conbus reverse proxy operations fail."""
@@ -108,9 +111,11 @@ class ReverseProxyService:
             self.server_socket.listen(5)  # Allow multiple connections in queue
 
             self.is_running = True
-            self.logger.info(f"Reverse proxy started on port {self.listen_port}")
+            self.logger.info("Reverse proxy started on port %s", self.listen_port)
             self.logger.info(
-                f"Forwarding to {self.cli_config.conbus.ip}:{self.cli_config.conbus.port}"
+                "Forwarding to %s:%s",
+                self.cli_config.conbus.ip,
+                self.cli_config.conbus.port,
             )
 
             # Print startup message
@@ -138,7 +143,7 @@ class ReverseProxyService:
             )
 
         except Exception as e:
-            self.logger.error(f"Failed to start reverse proxy: {e}")
+            self.logger.error("Failed to start reverse proxy: %s", e)
             return Response(
                 success=False, data=None, error=f"Failed to start reverse proxy: {e}"
             )
@@ -168,7 +173,7 @@ class ReverseProxyService:
                 self.logger.info("Reverse proxy stopped")
                 print("Reverse proxy stopped")
             except Exception as e:
-                self.logger.error(f"Error closing server socket: {e}")
+                self.logger.error("Error closing server socket: %s", e)
 
         return Response(
             success=True,
@@ -211,12 +216,16 @@ class ReverseProxyService:
                 if self.server_socket is None:
                     break
                 client_socket, client_address = self.server_socket.accept()
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
                 # Generate connection ID
                 self.connection_counter += 1
                 conn_id = f"conn_{self.connection_counter}"
 
-                self.logger.info(f"Client connected from {client_address} [{conn_id}]")
+                self.logger.info(
+                    "Client connected from %s [%s]", client_address, conn_id
+                )
                 print(
                     f"{self.timestamp()} [CONNECTION] Client {client_address} connected [{conn_id}]"
                 )
@@ -231,7 +240,7 @@ class ReverseProxyService:
 
             except Exception as e:
                 if self.is_running:
-                    self.logger.error(f"Error accepting connection: {e}")
+                    self.logger.error("Error accepting connection: %s", e)
                 break
 
     def _handle_client(
@@ -248,6 +257,8 @@ class ReverseProxyService:
         try:
             # Connect to target server
             server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             server_socket.settimeout(self.cli_config.conbus.timeout)
             server_socket.connect(
                 (self.cli_config.conbus.ip, self.cli_config.conbus.port)
@@ -263,7 +274,10 @@ class ReverseProxyService:
             }
 
             self.logger.info(
-                f"Connected to target server {self.cli_config.conbus.ip}:{self.cli_config.conbus.port} [{conn_id}]"
+                "Connected to target server %s:%s [%s]",
+                self.cli_config.conbus.ip,
+                self.cli_config.conbus.port,
+                conn_id,
             )
 
             # Set timeouts for idle connections
@@ -302,13 +316,13 @@ class ReverseProxyService:
             server_to_client_thread.join()
 
         except socket.timeout:
-            self.logger.info(f"Connection to target server timed out [{conn_id}]")
+            self.logger.info("Connection to target server timed out [%s]", conn_id)
             print(
                 f"{self.timestamp()} [ERROR] Connection to target server timed out [{conn_id}]"
             )
         except Exception as e:
             self.logger.error(
-                f"Error handling client {client_address}: {e} [{conn_id}]"
+                "Error handling client %s: %s [%s]", client_address, e, conn_id
             )
             print(f"{self.timestamp()} [ERROR] Connection error: {e} [{conn_id}]")
         finally:
@@ -332,22 +346,27 @@ class ReverseProxyService:
             dest_label: Label for destination in logs.
             conn_id: Connection identifier.
         """
+        buffer = bytearray(RELAY_BUFFER_SIZE)
+        view = memoryview(buffer)
         try:
             while self.is_running:
-                # Receive data from source
-                data = source_socket.recv(1024)
-                if not data:
+                # Receive data from source into the reused buffer
+                size = source_socket.recv_into(buffer)
+                if not size:
                     break
+                data = view[:size]
 
                 # Decode and print telegram
                 try:
-                    message = data.decode("latin-1").strip()
+                    message = bytes(data).decode("latin-1").strip()
                     if message:
-                        print(f"{self.timestamp()} [{source_label}] {message}")
-
-                        # Forward to destination
-                        dest_socket.send(data)
-                        print(f"{self.timestamp()} [{dest_label}] {message}")
+                        # Forward to destination, then log both legs in one write
+                        dest_socket.sendall(data)
+                        timestamp = self.timestamp()
+                        print(
+                            f"{timestamp} [{source_label}] {message}\n"
+                            f"{timestamp} [{dest_label}] {message}"
+                        )
 
                         # Update bytes relayed counter
                         if conn_id in self.active_connections:
@@ -357,22 +376,21 @@ class ReverseProxyService:
 
                 except UnicodeDecodeError:
                     # Handle binary data
+                    dest_socket.sendall(data)
+                    timestamp = self.timestamp()
                     print(
-                        f"{self.timestamp()} [{source_label}] <binary data: {len(data)} bytes>"
-                    )
-                    dest_socket.send(data)
-                    print(
-                        f"{self.timestamp()} [{dest_label}] <binary data: {len(data)} bytes>"
+                        f"{timestamp} [{source_label}] <binary data: {len(data)} bytes>\n"
+                        f"{timestamp} [{dest_label}] <binary data: {len(data)} bytes>"
                     )
 
                     if conn_id in self.active_connections:
                         self.active_connections[conn_id]["bytes_relayed"] += len(data)
 
         except socket.timeout:
-            self.logger.debug(f"Socket timeout in relay [{conn_id}]")
+            self.logger.debug("Socket timeout in relay [%s]", conn_id)
         except Exception as e:
             if self.is_running:
-                self.logger.error(f"Error in data relay: {e} [{conn_id}]")
+                self.logger.error("Error in data relay: %s [%s]", e, conn_id)
 
     def _close_connection_pair(self, conn_id: str) -> None:
         """
@@ -391,21 +409,24 @@ class ReverseProxyService:
             if "client_socket" in conn_info:
                 conn_info["client_socket"].close()
         except Exception as e:
-            self.logger.error(f"Error closing client socket: {e} [{conn_id}]")
+            self.logger.error("Error closing client socket: %s [%s]", e, conn_id)
 
         # Close server socket
         try:
             if "server_socket" in conn_info:
                 conn_info["server_socket"].close()
         except Exception as e:
-            self.logger.error(f"Error closing server socket: {e} [{conn_id}]")
+            self.logger.error("Error closing server socket: %s [%s]", e, conn_id)
 
         # Log disconnection
         client_address = conn_info.get("client_address", "unknown")
         bytes_relayed = conn_info.get("bytes_relayed", 0)
 
         self.logger.info(
-            f"Client {client_address} disconnected [{conn_id}] - {bytes_relayed} bytes relayed"
+            "Client %s disconnected [%s] - %s bytes relayed",
+            client_address,
+            conn_id,
+            bytes_relayed,
         )
         print(
             f"{self.timestamp()} [DISCONNECTION] "
@@ -8,7 +8,8 @@ functionality like module type response generation.
 import logging
 import threading
 from abc import ABC
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any, Callable, Optional
 
 from xp.models import ModuleTypeCode
 from xp.models.telegram.datapoint_type import DataPointType
@@ -16,6 +17,19 @@ from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.system_telegram import SystemTelegram
 from xp.utils.checksum import calculate_checksum
 
+# Reply value of each generic datapoint, read from the emulated module state
+_DATAPOINT_VALUES: dict[DataPointType, Callable[["BaseServerService"], str]] = {
+    DataPointType.TEMPERATURE: attrgetter("temperature"),
+    DataPointType.MODULE_TYPE_CODE: lambda server: f"{server.module_type_code.value:02}",
+    DataPointType.SW_VERSION: attrgetter("software_version"),
+    DataPointType.MODULE_STATE: attrgetter("device_status"),
+    DataPointType.MODULE_TYPE: attrgetter("device_type"),
+    DataPointType.LINK_NUMBER: lambda server: f"{server.link_number:02}",
+    DataPointType.VOLTAGE: attrgetter("voltage"),
+    DataPointType.HW_VERSION: attrgetter("hardware_version"),
+    DataPointType.MODULE_ERROR_CODE: lambda server: "00",
+}
+
 
 class BaseServerService(ABC):
     """
@@ -63,23 +77,13 @@ class BaseServerService(ABC):
         Returns:
             The response telegram string, or None if generation fails.
         """
-        datapoint_values = {
-            DataPointType.TEMPERATURE: self.temperature,
-            DataPointType.MODULE_TYPE_CODE: f"{self.module_type_code.value:02}",
-            DataPointType.SW_VERSION: self.software_version,
-            DataPointType.MODULE_STATE: self.device_status,
-            DataPointType.MODULE_TYPE: self.device_type,
-            DataPointType.LINK_NUMBER: f"{self.link_number:02}",
-            DataPointType.VOLTAGE: self.voltage,
-            DataPointType.HW_VERSION: self.hardware_version,
-            DataPointType.MODULE_ERROR_CODE: "00",
-        }
-        data_value = datapoint_values.get(datapoint_type) or "00"
+        value_of = _DATAPOINT_VALUES.get(datapoint_type)
+        data_value = (value_of(self) if value_of else None) or "00"
         data_part = f"R{self.serial_number}F02D{datapoint_type.value}{data_value}"
         telegram = self._build_response_telegram(data_part)
 
         self.logger.debug(
-            f"Generated {self.device_type} module type response: {telegram}"
+            "Generated %s module type response: %s", self.device_type, telegram
         )
         return telegram
 
@@ -118,7 +122,7 @@ class BaseServerService(ABC):
             telegram: The telegram string being logged.
         """
         self.logger.debug(
-            f"Generated {self.device_type} {response_type} response: {telegram}"
+            "Generated %s %s response: %s", self.device_type, response_type, telegram
         )
 
     def generate_discover_response(self) -> str:
@@ -157,7 +161,9 @@ class BaseServerService(ABC):
             data_part = f"R{self.serial_number}F18D"
             telegram = self._build_response_telegram(data_part)
 
-            self.logger.info(f"{self.device_type} link number set to {new_link_number}")
+            self.logger.info(
+                "%s link number set to %s", self.device_type, new_link_number
+            )
             return telegram
 
         return None
@@ -271,7 +277,7 @@ class BaseServerService(ABC):
         ):
             return self._handle_download_msactiontable_ack_request(request)
 
-        self.logger.warning(f"Unhandled {self.device_type} request: {request}")
+        self.logger.warning("Unhandled %s request: %s", self.device_type, request)
         return None
 
     def _handle_return_data_request(self, request: SystemTelegram) -> Optional[str]:
@@ -284,7 +290,7 @@ class BaseServerService(ABC):
             The response telegram string, or None if request cannot be handled.
         """
         self.logger.debug(
-            f"_handle_return_data_request {self.device_type} request: {request}"
+            "_handle_return_data_request %s request: %s", self.device_type, request
         )
         module_specific = self._handle_device_specific_data_request(request)
         if module_specific:
@@ -368,7 +374,7 @@ class BaseServerService(ABC):
         Args:
             telegram: The telegram string to add to the buffer.
         """
-        self.logger.debug(f"Add telegram to the buffer: {telegram}")
+        self.logger.debug("Add telegram to the buffer: %s", telegram)
         with self.telegram_buffer_lock:
             self.telegram_buffer.append(telegram)
 
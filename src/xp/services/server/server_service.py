@@ -7,8 +7,10 @@ Request telegrams with configurable device information.
 
 import logging
 import queue
+import selectors
 import socket
 import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -22,6 +24,13 @@ from xp.services.server.device_service_factory import DeviceServiceFactory
 from xp.services.telegram.telegram_discover_service import TelegramDiscoverService
 from xp.services.telegram.telegram_service import TelegramService
 
+# Seconds without data from a client before its connection is closed
+CLIENT_IDLE_TIMEOUT = 300
+# Seconds to wait for client data before flushing queued telegrams again
+CLIENT_POLL_INTERVAL = 0.05
+# Seconds a write to a client may block
+CLIENT_SEND_TIMEOUT = 10
+
 
 class ServerError(Exception):
     """Raised when Conbus server operations fail."""
@@ -87,15 +96,16 @@ class ServerService:
                 config = ConsonModuleListConfig.from_yaml(self.config_path)
                 self.devices = [module for module in config.root if module.enabled]
                 self._create_device_services()
-                self.logger.info(f"Loaded {len(self.devices)} devices from config")
+                self.logger.info("Loaded %s devices from config", len(self.devices))
             else:
                 self.logger.warning(
-                    f"Config file {self.config_path} not found, using empty device list"
+                    "Config file %s not found, using empty device list",
+                    self.config_path,
                 )
                 self.devices = []
                 self.device_services = {}
         except Exception as e:
-            self.logger.error(f"Error loading config file: {e}")
+            self.logger.error("Error loading config file: %s", e)
             self.devices = []
             self.device_services = {}
 
@@ -119,7 +129,7 @@ class ServerService:
 
             except Exception as e:
                 self.logger.error(
-                    f"Error creating device service for {serial_number}: {e}"
+                    "Error creating device service for %s: %s", serial_number, e
                 )
 
     def start_server(self) -> None:
@@ -144,16 +154,17 @@ class ServerService:
             self._start_device_collector_thread()
 
             self.is_running = True
-            self.logger.info(f"Conbus emulator server started on port {self.port}")
+            self.logger.info("Conbus emulator server started on port %s", self.port)
             self.logger.info(
-                f"Configured devices: {list([device.serial_number for device in self.devices])}"
+                "Configured devices: %s",
+                list([device.serial_number for device in self.devices]),
             )
 
             # Start accepting connections
             self._accept_connections()
 
         except Exception as e:
-            self.logger.error(f"Failed to start server: {e}")
+            self.logger.error("Failed to start server: %s", e)
             raise ServerError(f"Failed to start server: {e}")
 
     def stop_server(self) -> None:
@@ -168,7 +179,7 @@ class ServerService:
                 self.server_socket.close()
                 self.logger.info("Conbus emulator server stopped")
             except Exception as e:
-                self.logger.error(f"Error closing server socket: {e}")
+                self.logger.error("Error closing server socket: %s", e)
 
     def _accept_connections(self) -> None:
         """Accept and handle client connections."""
@@ -178,7 +189,8 @@ class ServerService:
                 if self.server_socket is None:
                     break
                 client_socket, client_address = self.server_socket.accept()
-                self.logger.info(f"Client connected from {client_address}")
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.logger.info("Client connected from %s", client_address)
 
                 # Handle client in separate thread
                 client_thread = threading.Thread(
@@ -189,7 +201,7 @@ class ServerService:
 
             except Exception as e:
                 if self.is_running:
-                    self.logger.error(f"Error accepting connection: {e}")
+                    self.logger.error("Error accepting connection: %s", e)
                 break
 
     def _handle_client(
@@ -200,62 +212,75 @@ class ServerService:
         client_queue = self.client_buffers.register_client(client_socket)
 
         try:
-
-            idle_timeout = 300
-            rcv_timeout = 10
-
-            # Set timeout for idle connections (30 seconds as per spec)
-            client_socket.settimeout(rcv_timeout)
-            timeout = idle_timeout / rcv_timeout
-
-            while True:
-
-                # send waiting buffer from client's dedicated queue
-                while not client_queue.empty():
-                    try:
-                        buffer = client_queue.get_nowait()
-                        client_socket.send(buffer.encode("latin-1"))
-                        self.logger.debug(f"Sent buffer to {client_address}")
-                    except queue.Empty:
+            # Blocking writes to a stuck client still give up after a while
+            client_socket.settimeout(CLIENT_SEND_TIMEOUT)
+            idle_deadline = time.monotonic() + CLIENT_IDLE_TIMEOUT
+
+            # Receive buffer reused for every read on this connection
+            recv_buffer = bytearray(1024)
+            # Received bytes not yet terminated by a closing ">"
+            pending_data = bytearray()
+
+            with selectors.DefaultSelector() as selector:
+                selector.register(client_socket, selectors.EVENT_READ)
+
+                while True:
+
+                    # send waiting buffers from client's dedicated queue in one write
+                    pending = []
+                    while not client_queue.empty():
+                        try:
+                            pending.append(client_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    if pending:
+                        client_socket.sendall("".join(pending).encode("latin-1"))
+                        self.logger.debug("Sent buffer to %s", client_address)
+
+                    # Poll briefly so telegrams queued for this client by other
+                    # connections are not held back until the client sends data
+                    if not selector.select(timeout=CLIENT_POLL_INTERVAL):
+                        if time.monotonic() >= idle_deadline:
+                            break
+                        continue
+
+                    size = client_socket.recv_into(recv_buffer)
+                    if not size:
+                        # Client closed the connection
                         break
 
-                # Receive data from client
-                data = None
-                try:
-                    data = client_socket.recv(1024)
-                except socket.timeout:
-                    pass
-                finally:
-                    timeout -= 1
-
-                if not data:
-                    if timeout <= 0:
-                        break
-                    continue
-
-                # reset timeout on receiving data
-                timeout = idle_timeout / rcv_timeout
-
-                message = data.decode("latin-1").strip()
-                self.logger.debug(f"Received from {client_address}: {message}")
-
-                # Process request (discover or data request)
-                responses = self._process_request(message)
-                for response in responses:
-                    self.client_buffers.broadcast(response)
+                    # reset timeout on receiving data
+                    idle_deadline = time.monotonic() + CLIENT_IDLE_TIMEOUT
+
+                    # Only handle complete telegrams, keep a split one for the
+                    # next read
+                    pending_data += recv_buffer[:size]
+                    frame_end = pending_data.rfind(b">") + 1
+                    if not frame_end:
+                        if b"<" not in pending_data:
+                            pending_data.clear()
+                        continue
+                    message = pending_data[:frame_end].decode("latin-1").strip()
+                    del pending_data[:frame_end]
+                    self.logger.debug("Received from %s: %s", client_address, message)
+
+                    # Process request (discover or data request)
+                    responses = self._process_request(message)
+                    for response in responses:
+                        self.client_buffers.broadcast(response)
 
         except socket.timeout:
-            self.logger.debug(f"Client {client_address} timed out")
+            self.logger.debug("Client %s timed out", client_address)
         except Exception as e:
-            self.logger.error(f"Error handling client {client_address}: {e}")
+            self.logger.error("Error handling client %s: %s", client_address, e)
         finally:
             try:
                 # Unregister client before closing socket
                 self.client_buffers.unregister_client(client_socket)
                 client_socket.close()
-                self.logger.info(f"Client {client_address} disconnected")
+                self.logger.info("Client %s disconnected", client_address)
             except Exception as e:
-                self.logger.error(f"Error closing client socket: {e}")
+                self.logger.error("Error closing client socket: %s", e)
 
     def _process_request(self, message: str) -> List[str]:
         """
@@ -274,7 +299,7 @@ class ServerService:
             telegrams = self._split_telegrams(message)
 
             if not telegrams:
-                self.logger.warning(f"No valid telegrams found in message: {message}")
+                self.logger.warning("No valid telegrams found in message: %s", message)
                 return responses
 
             # Process each telegram
@@ -283,7 +308,7 @@ class ServerService:
                 responses.extend(telegram_responses)
 
         except Exception as e:
-            self.logger.error(f"Error processing request: {e}")
+            self.logger.error("Error processing request: %s", e)
 
         return responses
 
@@ -310,7 +335,7 @@ class ServerService:
             end_idx = message.find(">", start_idx)
             if end_idx == -1:
                 self.logger.warning(
-                    f"Incomplete telegram found starting at position {start_idx}"
+                    "Incomplete telegram found starting at position %s", start_idx
                 )
                 break
 
@@ -340,7 +365,7 @@ class ServerService:
             parsed_telegram = self.telegram_service.parse_system_telegram(telegram)
 
             if not parsed_telegram:
-                self.logger.warning(f"Failed to parse telegram: {telegram}")
+                self.logger.warning("Failed to parse telegram: %s", telegram)
                 return responses
 
             # self.client_buffers.broadcast(parsed_telegram.raw_telegram)
@@ -373,11 +398,11 @@ class ServerService:
                             responses.append(f"{device_response}\n")
                     else:
                         self.logger.debug(
-                            f"No device found for serial: {serial_number}"
+                            "No device found for serial: %s", serial_number
                         )
 
         except Exception as e:
-            self.logger.error(f"Error processing telegram: {e}")
+            self.logger.error("Error processing telegram: %s", e)
 
         return responses
 
@@ -399,7 +424,9 @@ class ServerService:
         """Reload device configuration from file."""
         self._load_device_config()
         self.logger.info(
-            f"Configuration reloaded: {len(self.devices)} devices, {len(self.device_services)} services"
+            "Configuration reloaded: %s devices, %s services",
+            len(self.devices),
+            len(self.device_services),
         )
 
     def _start_device_collector_thread(self) -> None:
@@ -421,7 +448,7 @@ class ServerService:
             self.logger.debug("Collector thread not running")
             return
 
-        self.logger.info(f"Stopping collector thread: {self.collector_thread.name}")
+        self.logger.info("Stopping collector thread: %s", self.collector_thread.name)
 
         # Wait for thread to finish (with timeout)
         if self.collector_thread and self.collector_thread.is_alive():
@@ -5,7 +5,7 @@ This service provides XP24-specific device emulation functionality, including re
 generation and device configuration handling.
 """
 
-from typing import Dict, Optional
+from typing import Callable, ClassVar, Dict, Optional
 
 from xp.models import ModuleTypeCode
 from xp.models.actiontable.msactiontable_xp24 import InputAction, Xp24MsActionTable
@@ -81,7 +81,7 @@ class XP24ServerService(BaseServerService):
         """Handle XP24-specific data requests."""
         telegrams = self._handle_action_module_output_state(request.data)
         self.logger.debug(
-            f"Generated {self.device_type} module type responses: {telegrams}"
+            "Generated %s module type responses: %s", self.device_type, telegrams
         )
         return telegrams
 
@@ -156,22 +156,18 @@ class XP24ServerService(BaseServerService):
             return None
 
         datapoint_type = request.datapoint_type
-        handler = {
-            DataPointType.MODULE_OUTPUT_STATE: self._handle_read_module_output_state,
-            DataPointType.MODULE_STATE: self._handle_read_module_state,
-            DataPointType.MODULE_OPERATING_HOURS: self._handle_read_module_operating_hours,
-        }.get(datapoint_type)
+        handler = self._DATAPOINT_HANDLERS.get(datapoint_type)
         if not handler:
             return None
 
-        data_value = handler()
+        data_value = handler(self)
         data_part = (
             f"R{self.serial_number}" f"F02D{datapoint_type.value}" f"{data_value}"
         )
         telegram = self._build_response_telegram(data_part)
 
         self.logger.debug(
-            f"Generated {self.device_type} module type response: {telegram}"
+            "Generated %s module type response: %s", self.device_type, telegram
         )
         return telegram
 
@@ -196,6 +192,15 @@ class XP24ServerService(BaseServerService):
             f"{1 if self.output_3.state else 0}"
         )
 
+    # Reply value of each device-specific datapoint, read from the module state
+    _DATAPOINT_HANDLERS: ClassVar[
+        Dict[DataPointType, Callable[["XP24ServerService"], str]]
+    ] = {
+        DataPointType.MODULE_OUTPUT_STATE: _handle_read_module_output_state,
+        DataPointType.MODULE_STATE: _handle_read_module_state,
+        DataPointType.MODULE_OPERATING_HOURS: _handle_read_module_operating_hours,
+    }
+
     def _get_msactiontable_serializer(self) -> Optional[Xp24MsActionTableSerializer]:
         """
         Get the MsActionTable serializer for XP24.
@@ -7,7 +7,7 @@ generation and device configuration handling for 3-channel light dimmer modules.
 
 import socket
 import threading
-from typing import Dict, Optional
+from typing import Callable, ClassVar, Dict, Optional
 
 from xp.models import ModuleTypeCode
 from xp.models.actiontable.msactiontable_xp33 import Xp33MsActionTable
@@ -107,7 +107,9 @@ class XP33ServerService(BaseServerService):
     ) -> Optional[str]:
         """Handle XP33-specific action requests."""
         telegrams = self._handle_action_channel_dimming(request.data)
-        self.logger.debug(f"Generated {self.device_type} action responses: {telegrams}")
+        self.logger.debug(
+            "Generated %s action responses: %s", self.device_type, telegrams
+        )
         return telegrams
 
     def _handle_action_channel_dimming(self, data_value: str) -> str:
@@ -214,21 +216,16 @@ class XP33ServerService(BaseServerService):
         # If in storm mode and not MODULE_ERROR_CODE query, ignore (background thread is sending)
         if self.storm_mode:
             self.logger.debug(
-                f"Ignoring query during storm mode for device {self.serial_number}"
+                "Ignoring query during storm mode for device %s", self.serial_number
             )
             return None  # Background thread is sending storm telegrams
 
         # Normal data request handling
-        handler = {
-            DataPointType.MODULE_OUTPUT_STATE: self._handle_read_module_output_state,
-            DataPointType.MODULE_STATE: self._handle_read_module_state,
-            DataPointType.MODULE_OPERATING_HOURS: self._handle_read_module_operating_hours,
-            DataPointType.MODULE_LIGHT_LEVEL: self._handle_read_light_level,
-        }.get(datapoint_type)
+        handler = self._DATAPOINT_HANDLERS.get(datapoint_type)
         if not handler:
             return None
 
-        data_value = handler()
+        data_value = handler(self)
         data_part = (
             f"R{self.serial_number}" f"F02D{datapoint_type.value}" f"{data_value}"
         )
@@ -238,7 +235,7 @@ class XP33ServerService(BaseServerService):
         self.last_response = telegram
 
         self.logger.debug(
-            f"Generated {self.device_type} module type response: {telegram}"
+            "Generated %s module type response: %s", self.device_type, telegram
         )
         return telegram
 
@@ -288,6 +285,16 @@ class XP33ServerService(BaseServerService):
         ]
         return ",".join(levels)
 
+    # Reply value of each device-specific datapoint, read from the module state
+    _DATAPOINT_HANDLERS: ClassVar[
+        Dict[DataPointType, Callable[["XP33ServerService"], str]]
+    ] = {
+        DataPointType.MODULE_OUTPUT_STATE: _handle_read_module_output_state,
+        DataPointType.MODULE_STATE: _handle_read_module_state,
+        DataPointType.MODULE_OPERATING_HOURS: _handle_read_module_operating_hours,
+        DataPointType.MODULE_LIGHT_LEVEL: _handle_read_light_level,
+    }
+
     def _trigger_storm_mode(self) -> Optional[str]:
         """
         Trigger storm mode via D99 query.
@@ -301,15 +308,16 @@ class XP33ServerService(BaseServerService):
         # If storm already active, just log and continue
         if self.storm_mode and self.storm_thread and self.storm_thread.is_alive():
             self.logger.debug(
-                f"Storm already active for device {self.serial_number}, "
-                f"sent {self.storm_packets_sent}/200 packets"
+                "Storm already active for device %s, sent %s/200 packets",
+                self.serial_number,
+                self.storm_packets_sent,
             )
             return None
 
         if not self.last_response:
             self.logger.warning(
-                f"Cannot trigger storm for device {self.serial_number}: "
-                f"no cached response"
+                "Cannot trigger storm for device %s: no cached response",
+                self.serial_number,
             )
             return None
 
@@ -326,7 +334,7 @@ class XP33ServerService(BaseServerService):
         self.storm_thread.start()
 
         self.logger.info(
-            f"Storm triggered via D99 query for device {self.serial_number}"
+            "Storm triggered via D99 query for device %s", self.serial_number
         )
         return None  # No response when entering storm mode
 
@@ -340,7 +348,8 @@ class XP33ServerService(BaseServerService):
             MODULE_ERROR_CODE response with error code FE (buffer overflow).
         """
         self.logger.info(
-            f"MODULE_ERROR_CODE query received, stopping storm for device {self.serial_number}"
+            "MODULE_ERROR_CODE query received, stopping storm for device %s",
+            self.serial_number,
         )
 
         # Signal the storm thread to stop
@@ -352,10 +361,13 @@ class XP33ServerService(BaseServerService):
             self.storm_thread.join(timeout=1.0)
 
         self.logger.info(
-            f"Storm stopped after {self.storm_packets_sent} packets for device {self.serial_number}"
+            "Storm stopped after %s packets for device %s",
+            self.storm_packets_sent,
+            self.serial_number,
         )
         self.logger.info(
-            f"Storm stopped, returning to normal operation for device {self.serial_number}"
+            "Storm stopped, returning to normal operation for device %s",
+            self.serial_number,
         )
         return self._build_error_code_response("FE")
 
@@ -372,13 +384,15 @@ class XP33ServerService(BaseServerService):
         """
         if not self.last_response:
             self.logger.error(
-                f"Storm thread started but missing cached response for {self.serial_number}"
+                "Storm thread started but missing cached response for %s",
+                self.serial_number,
             )
             self.storm_mode = False
             return
 
         self.logger.info(
-            f"Storm thread started, sending 200 duplicate telegrams at 2 packets/sec for device {self.serial_number}"
+            "Storm thread started, sending 200 duplicate telegrams at 2 packets/sec for device %s",
+            self.serial_number,
         )
 
         # Type narrowing for mypy
@@ -396,7 +410,10 @@ class XP33ServerService(BaseServerService):
                 self.add_telegram_buffer(cached_response)
                 self.storm_packets_sent += 1
                 self.logger.debug(
-                    f"Storm packet {self.storm_packets_sent}/{max_packets} sent for {self.serial_number}"
+                    "Storm packet %s/%s sent for %s",
+                    self.storm_packets_sent,
+                    max_packets,
+                    self.serial_number,
                 )
 
                 # Wait before sending next packet (0.5 seconds for 2 packets/sec)
@@ -406,11 +423,15 @@ class XP33ServerService(BaseServerService):
                 # Log completion status
             if self.storm_packets_sent >= max_packets:
                 self.logger.info(
-                    f"Storm completed: sent all {self.storm_packets_sent} packets for {self.serial_number}"
+                    "Storm completed: sent all %s packets for %s",
+                    self.storm_packets_sent,
+                    self.serial_number,
                 )
             elif self.storm_stop_event.is_set():
                 self.logger.info(
-                    f"Storm stopped by error code query: sent {self.storm_packets_sent} packets for {self.serial_number}"
+                    "Storm stopped by error code query: sent %s packets for %s",
+                    self.storm_packets_sent,
+                    self.serial_number,
                 )
 
             # Clean up storm mode
@@ -418,7 +439,7 @@ class XP33ServerService(BaseServerService):
 
         except Exception as e:
             self.logger.error(
-                f"Unexpected error in storm thread for {self.serial_number}: {e}"
+                "Unexpected error in storm thread for %s: %s", self.serial_number, e
             )
             self.storm_mode = False
 
@@ -439,7 +460,7 @@ class XP33ServerService(BaseServerService):
         )
         telegram = self._build_response_telegram(data_part)
         self.logger.debug(
-            f"Generated {self.device_type} error code response: {telegram}"
+            "Generated %s error code response: %s", self.device_type, telegram
         )
         return telegram
 
@@ -456,7 +477,7 @@ class XP33ServerService(BaseServerService):
         """
         if 1 <= channel <= 3 and 0 <= level <= 100:
             self.channel_states[channel - 1] = level
-            self.logger.info(f"XP33 channel {channel} set to {level}%")
+            self.logger.info("XP33 channel %s set to %s%%", channel, level)
             return True
         return False
 
@@ -472,7 +493,7 @@ class XP33ServerService(BaseServerService):
         """
         if scene in self.scenes:
             self.channel_states = self.scenes[scene].copy()
-            self.logger.info(f"XP33 scene {scene} activated: {self.channel_states}")
+            self.logger.info("XP33 scene %s activated: %s", scene, self.channel_states)
             return True
         return False
 
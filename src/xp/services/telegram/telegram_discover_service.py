@@ -5,6 +5,7 @@ This service handles generation and parsing of device discover system telegrams
 enumerating all connected devices on the console bus.
 """
 
+import re
 from typing import List, Set
 
 from xp.models.telegram.reply_telegram import ReplyTelegram
@@ -12,6 +13,9 @@ from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.system_telegram import SystemTelegram
 from xp.utils.checksum import calculate_checksum
 
+# Discover response format: <R{10-digit-serial}F01D{2-char-checksum}>
+_DISCOVER_RESPONSE_PATTERN = re.compile(r"^<R(\d{10})F01D([A-Z0-9]{2})>$")
+
 
 class DiscoverError(Exception):
     """Raised when discover operations fail."""
@@ -187,13 +191,7 @@ class TelegramDiscoverService:
         Returns:
             True if format matches discover response pattern.
         """
-        # Discover response format: <R{10-digit-serial}F01D{2-char-checksum}>
-        import re
-
-        match = re.compile(r"^<R(\d{10})F01D([A-Z0-9]{2})>$").match(
-            raw_telegram.strip()
-        )
-
+        match = _DISCOVER_RESPONSE_PATTERN.match(raw_telegram.strip())
         return match is not None
 
     def generate_discover_summary(self, devices: List[DeviceInfo]) -> dict:
@@ -19,6 +19,11 @@ from xp.models.telegram.system_telegram import SystemTelegram
 from xp.models.telegram.telegram_type import TelegramType
 from xp.utils.checksum import calculate_checksum
 
+# Type codes of telegrams parsed as event telegrams
+EVENT_TELEGRAM_TYPE_CODES = frozenset(
+    {TelegramType.EVENT.value, TelegramType.CPEVENT.value}
+)
+
 
 class TelegramParsingError(Exception):
     """Raised when telegram parsing fails."""
@@ -252,7 +257,7 @@ class TelegramService:
             raise TelegramParsingError("Empty telegram string")
 
         # Validate and parse using regex
-        self.logger.debug(f"Parsing reply telegram {raw_telegram}")
+        self.logger.debug("Parsing reply telegram %s", raw_telegram)
         match = self.REPLY_TELEGRAM_PATTERN.match(raw_telegram.strip())
         if not match:
             raise TelegramParsingError(f"Invalid reply telegram format: {raw_telegram}")
@@ -321,11 +326,9 @@ class TelegramService:
             raise TelegramParsingError("Empty telegram string")
 
         # Then check general telegram types
-        telegram_type_code = (
-            raw_telegram.strip()[1] if len(raw_telegram.strip()) > 1 else ""
-        )
+        telegram_type_code = raw_telegram.strip()[1:2]
 
-        if telegram_type_code in (TelegramType.EVENT.value, TelegramType.CPEVENT.value):
+        if telegram_type_code in EVENT_TELEGRAM_TYPE_CODES:
             return self.parse_event_telegram(raw_telegram)
         elif telegram_type_code == TelegramType.SYSTEM.value:
             return self.parse_system_telegram(raw_telegram)
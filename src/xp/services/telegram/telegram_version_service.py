@@ -14,6 +14,13 @@ from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.system_telegram import SystemTelegram
 from xp.utils.checksum import calculate_checksum
 
+# Version number part of a version string, e.g. 1.00.04
+_VERSION_PATTERN = re.compile(r"^\d+\.\d+\.\d+$")
+# Serial-independent tail of a version request: read datapoint 02 (software version)
+_VERSION_REQUEST_SUFFIX = (
+    f"F{SystemFunction.READ_DATAPOINT.value}D{DataPointType.SW_VERSION.value}"
+)
+
 
 class VersionParsingError(Exception):
     """Raised when version parsing fails."""
@@ -49,8 +56,7 @@ class VersionService:
                     version = parts[1]
 
                     # Validate version format (should be like 1.00.04)
-                    version_pattern = re.compile(r"^\d+\.\d+\.\d+$")
-                    if version_pattern.match(version):
+                    if _VERSION_PATTERN.match(version):
                         return Response(
                             success=True,
                             data={
@@ -111,7 +117,7 @@ class VersionService:
 
             # Build telegram: S{serial_number}F{function}D{data_point}
             # Function 02 = Read Data point, Data Point 02 = Version
-            data_part = f"S{serial_number}F02D02"
+            data_part = f"S{serial_number}{_VERSION_REQUEST_SUFFIX}"
 
             # Calculate checksum
             checksum = calculate_checksum(data_part)
@@ -169,7 +169,10 @@ class HomekitAccessoryDriver:
             config = self._homekit_config
             pincode = config.homekit.pincode.encode()
             self.logger.info(
-                f"Starting HAP driver on {config.homekit.ip}:{config.homekit.port} with pincode {config.homekit.pincode}"
+                "Starting HAP driver on %s:%s with pincode %s",
+                config.homekit.ip,
+                config.homekit.port,
+                config.homekit.pincode,
             )
             self._driver = AccessoryDriver(
                 loop=loop,
@@ -182,7 +185,7 @@ class HomekitAccessoryDriver:
             await self._driver.async_start()
             self.logger.info("AccessoryDriver started successfully")
         except Exception as e:
-            self.logger.error(f"Error starting AccessoryDriver: {e}", exc_info=True)
+            self.logger.error("Error starting AccessoryDriver: %s", e, exc_info=True)
 
     async def stop(self) -> None:
         """Stop the AccessoryDriver."""
@@ -192,7 +195,7 @@ class HomekitAccessoryDriver:
             await self._driver.async_stop()
             self.logger.info("AccessoryDriver stopped successfully")
         except Exception as e:
-            self.logger.error(f"Error stopping AccessoryDriver: {e}", exc_info=True)
+            self.logger.error("Error stopping AccessoryDriver: %s", e, exc_info=True)
 
     def update_state(
         self, accessory_name: str, is_on: bool, brightness: Optional[int] = None
@@ -209,7 +212,7 @@ class HomekitAccessoryDriver:
         if acc:
             acc.update_state(is_on, brightness)
         else:
-            self.logger.warning(f"Unknown accessory name: {accessory_name}")
+            self.logger.warning("Unknown accessory name: %s", accessory_name)
 
     def get_brightness(self, accessory_name: str) -> int:
         """
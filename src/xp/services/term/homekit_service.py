@@ -10,7 +10,10 @@ from xp.models.config.conson_module_config import ConsonModuleListConfig
 from xp.models.homekit.homekit_config import HomekitAccessoryConfig, HomekitConfig
 from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
 from xp.models.telegram.datapoint_type import DataPointType
-from xp.models.telegram.module_type_code import ModuleTypeCode
+from xp.models.telegram.module_type_code import (
+    XP33_MODULE_TYPE_CODES,
+    ModuleTypeCode,
+)
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
 from xp.models.term.accessory_state import AccessoryState
@@ -101,7 +104,7 @@ class HomekitService:
                 accessory_config = self._find_accessory_config(accessory_name)
                 if not accessory_config:
                     self.logger.warning(
-                        f"Accessory config not found for {accessory_name}"
+                        "Accessory config not found for %s", accessory_name
                     )
                     continue
 
@@ -110,7 +113,7 @@ class HomekitService:
                 )
                 if not module_config:
                     self.logger.warning(
-                        f"Module config not found for {accessory_config.serial_number}"
+                        "Module config not found for %s", accessory_config.serial_number
                     )
                     continue
 
@@ -257,7 +260,7 @@ class HomekitService:
         """Initiate connection to server."""
         if not self._state_machine.can_transition("connect"):
             self.logger.warning(
-                f"Cannot connect: current state is {self._connection_state.value}"
+                "Cannot connect: current state is %s", self._connection_state.value
             )
             return
 
@@ -272,7 +275,7 @@ class HomekitService:
         """Disconnect from server."""
         if not self._state_machine.can_transition("disconnect"):
             self.logger.warning(
-                f"Cannot disconnect: current state is {self._connection_state.value}"
+                "Cannot disconnect: current state is %s", self._connection_state.value
             )
             return
 
@@ -313,7 +316,7 @@ class HomekitService:
         """
         config = self._find_accessory_config(accessory_name)
         if not config:
-            self.logger.warning(f"No config found for accessory: {accessory_name}")
+            self.logger.warning("No config found for accessory: %s", accessory_name)
             return
 
         if brightness is not None:
@@ -357,14 +360,14 @@ class HomekitService:
         if delta > 0:
             # Increase brightness
             if not config.dimup_action:
-                self.logger.warning(f"No dimup_action for {accessory_name}")
+                self.logger.warning("No dimup_action for %s", accessory_name)
                 return
             action = config.dimup_action
             direction = "+"
         else:
             # Decrease brightness
             if not config.dimdown_action:
-                self.logger.warning(f"No dimdown_action for {accessory_name}")
+                self.logger.warning("No dimdown_action for %s", accessory_name)
                 return
             action = config.dimdown_action
             direction = "-"
@@ -426,7 +429,7 @@ class HomekitService:
         """
         state = self._accessory_states.get(accessory_id)
         if not state or not state.toggle_action:
-            self.logger.warning(f"No toggle_action for accessory {accessory_id}")
+            self.logger.warning("No toggle_action for accessory %s", accessory_id)
             return False
 
         self.send_action(state.toggle_action)
@@ -446,7 +449,7 @@ class HomekitService:
         config = self._find_accessory_config_by_id(accessory_id)
         state = self._accessory_states.get(accessory_id)
         if not config or not state:
-            self.logger.warning(f"No config for accessory {accessory_id}")
+            self.logger.warning("No config for accessory %s", accessory_id)
             return False
 
         self.send_action(config.on_action)
@@ -466,7 +469,7 @@ class HomekitService:
         config = self._find_accessory_config_by_id(accessory_id)
         state = self._accessory_states.get(accessory_id)
         if not config or not state:
-            self.logger.warning(f"No config for accessory {accessory_id}")
+            self.logger.warning("No config for accessory %s", accessory_id)
             return False
 
         self.send_action(config.off_action)
@@ -486,7 +489,7 @@ class HomekitService:
         config = self._find_accessory_config_by_id(accessory_id)
         state = self._accessory_states.get(accessory_id)
         if not config or not state or not config.dimup_action:
-            self.logger.warning(f"No config for accessory {accessory_id}")
+            self.logger.warning("No config for accessory %s", accessory_id)
             return False
 
         self.send_action(config.dimup_action)
@@ -506,7 +509,7 @@ class HomekitService:
         config = self._find_accessory_config_by_id(accessory_id)
         state = self._accessory_states.get(accessory_id)
         if not config or not state or not config.dimdown_action:
-            self.logger.warning(f"No config for accessory {accessory_id}")
+            self.logger.warning("No config for accessory %s", accessory_id)
             return False
 
         self.send_action(config.dimdown_action)
@@ -528,7 +531,7 @@ class HomekitService:
         config = self._find_accessory_config_by_id(accessory_id)
         state = self._accessory_states.get(accessory_id)
         if not config or not state or not config.levelup_action:
-            self.logger.warning(f"No config for accessory {accessory_id}")
+            self.logger.warning("No config for accessory %s", accessory_id)
             return False
 
         return self._send_level_action(
@@ -550,7 +553,7 @@ class HomekitService:
         config = self._find_accessory_config_by_id(accessory_id)
         state = self._accessory_states.get(accessory_id)
         if not config or not state or not config.leveldown_action:
-            self.logger.warning(f"No config for accessory {accessory_id}")
+            self.logger.warning("No config for accessory %s", accessory_id)
             return False
 
         return self._send_level_action(
@@ -625,7 +628,9 @@ class HomekitService:
                 self._query_module_output_state(state.serial_number)
                 queried_serials.add(state.serial_number)
                 self.logger.debug(
-                    f"Querying output state for {state.module_name} ({state.module_type})"
+                    "Querying output state for %s (%s)",
+                    state.module_name,
+                    state.module_type,
                 )
 
     def _query_module_output_state(self, serial_number: str) -> None:
@@ -712,6 +717,8 @@ class HomekitService:
         # Parse output state bits using TelegramOutputService
         outputs = TelegramOutputService.format_output_state(data_value)
         output_list = outputs.split() if outputs else []
+        # One reply updates all its accessories at the same instant
+        received_at = datetime.now()
 
         # Update all accessories for this serial_number
         for state in self._accessory_states.values():
@@ -735,7 +742,7 @@ class HomekitService:
                 else:
                     state.output_state = "?"
 
-                state.last_update = datetime.now()
+                state.last_update = received_at
                 self.on_module_state_changed.emit(state)
 
     def _handle_event_telegram(self, event: TelegramReceivedEvent) -> None:
@@ -758,11 +765,7 @@ class HomekitService:
             else:
                 return
 
-        elif event_telegram.module_type in (
-            ModuleTypeCode.XP33.value,
-            ModuleTypeCode.XP33LR.value,
-            ModuleTypeCode.XP33LED.value,
-        ):
+        elif event_telegram.module_type in XP33_MODULE_TYPE_CODES:
             if 80 <= event_telegram.input_number <= 82:
                 output_number = event_telegram.input_number - 80
             else:
@@ -772,6 +775,7 @@ class HomekitService:
 
         # Find accessories matching link number and output
         output_1_based = output_number + 1
+        received_at = datetime.now()
         for state in self._accessory_states.values():
             module_config = self._conson_config.find_module(state.serial_number)
             if not module_config:
@@ -796,11 +800,11 @@ class HomekitService:
                 if config:
                     self._accessory_driver.update_state(config.name, is_on)
 
-                state.last_update = datetime.now()
+                state.last_update = received_at
                 self.on_module_state_changed.emit(state)
 
                 self.logger.debug(
-                    f"Updated {state.accessory_name} to {'ON' if is_on else 'OFF'}"
+                    "Updated %s to %s", state.accessory_name, "ON" if is_on else "OFF"
                 )
 
     def _on_timeout(self) -> None:
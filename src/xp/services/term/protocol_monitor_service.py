@@ -101,7 +101,7 @@ class ProtocolMonitorService:
         """Initiate connection to server."""
         if not self._state_machine.can_transition("connect"):
             self.logger.warning(
-                f"Cannot connect: current state is {self._connection_state.value}"
+                "Cannot connect: current state is %s", self._connection_state.value
             )
             return
 
@@ -116,7 +116,7 @@ class ProtocolMonitorService:
         """Disconnect from server."""
         if not self._state_machine.can_transition("disconnect"):
             self.logger.warning(
-                f"Cannot disconnect: current state is {self._connection_state.value}"
+                "Cannot disconnect: current state is %s", self._connection_state.value
             )
             return
 
@@ -161,7 +161,7 @@ class ProtocolMonitorService:
             self._conbus_protocol.send_raw_telegram(telegram)
             self.on_status_message.emit(f"{name} sent.")
         except Exception as e:
-            self.logger.error(f"Failed to send telegram: {e}")
+            self.logger.error("Failed to send telegram: %s", e)
             self.on_status_message.emit(f"Failed: {e}")
 
     def handle_key_press(self, key: str) -> bool:
@@ -9,7 +9,10 @@ from psygnal import Signal
 from xp.models.config.conson_module_config import ConsonModuleListConfig
 from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
 from xp.models.telegram.datapoint_type import DataPointType
-from xp.models.telegram.module_type_code import ModuleTypeCode
+from xp.models.telegram.module_type_code import (
+    XP33_MODULE_TYPE_CODES,
+    ModuleTypeCode,
+)
 from xp.models.telegram.system_function import SystemFunction
 from xp.models.telegram.telegram_type import TelegramType
 from xp.models.term.connection_state import ConnectionState
@@ -143,7 +146,7 @@ class StateMonitorService:
         """Initiate connection to server."""
         if not self._state_machine.can_transition("connect"):
             self.logger.warning(
-                f"Cannot connect: current state is {self._connection_state.value}"
+                "Cannot connect: current state is %s", self._connection_state.value
             )
             return
 
@@ -158,7 +161,7 @@ class StateMonitorService:
         """Disconnect from server."""
         if not self._state_machine.can_transition("disconnect"):
             self.logger.warning(
-                f"Cannot disconnect: current state is {self._connection_state.value}"
+                "Cannot disconnect: current state is %s", self._connection_state.value
             )
             return
 
@@ -209,7 +212,9 @@ class StateMonitorService:
             if module_state.module_type in eligible_types:
                 self._query_module_output_state(module_state.serial_number)
                 self.logger.debug(
-                    f"Querying output state for {module_state.name} ({module_state.module_type})"
+                    "Querying output state for %s (%s)",
+                    module_state.name,
+                    module_state.module_type,
                 )
 
     def _query_module_output_state(self, serial_number: str) -> None:
@@ -295,7 +300,7 @@ class StateMonitorService:
             module_state.last_update = datetime.now()
 
             self.on_module_state_changed.emit(module_state)
-            self.logger.debug(f"Updated outputs for {module_state.name}: {outputs}")
+            self.logger.debug("Updated outputs for %s: %s", module_state.name, outputs)
 
     def _on_timeout(self) -> None:
         """Handle timeout event."""
@@ -378,28 +383,24 @@ class StateMonitorService:
                 output_number = event_telegram.input_number - 80
             else:
                 self.logger.debug(
-                    f"Ignoring XP24 input event I{event_telegram.input_number:02d}"
+                    "Ignoring XP24 input event I%02d", event_telegram.input_number
                 )
                 return
 
-        elif event_telegram.module_type in (
-            ModuleTypeCode.XP33.value,
-            ModuleTypeCode.XP33LR.value,
-            ModuleTypeCode.XP33LED.value,
-        ):
+        elif event_telegram.module_type in XP33_MODULE_TYPE_CODES:
             # XP33 modules use input_number 0-2 for channels 0-2
             if 80 <= event_telegram.input_number <= 82:
                 output_number = event_telegram.input_number - 80
             else:
                 self.logger.debug(
-                    f"Ignoring XP33 input event I{event_telegram.input_number:02d}"
+                    "Ignoring XP33 input event I%02d", event_telegram.input_number
                 )
                 return
 
         else:
             # Ignore events from other module types
             self.logger.debug(
-                f"Ignoring event from module type {event_telegram.module_type}"
+                "Ignoring event from module type %s", event_telegram.module_type
             )
             return
 
@@ -407,7 +408,7 @@ class StateMonitorService:
         module_state = self._find_module_by_link(event_telegram.link_number)
         if not module_state:
             self.logger.debug(
-                f"Module not found for link number {event_telegram.link_number}"
+                "Module not found for link number %s", event_telegram.link_number
             )
             return
 
@@ -421,8 +422,10 @@ class StateMonitorService:
         # Emit signal for UI update
         self.on_module_state_changed.emit(module_state)
         self.logger.debug(
-            f"Updated {module_state.name} output {output_number} to "
-            f"{'ON' if output_state else 'OFF'}"
+            "Updated %s output %s to %s",
+            module_state.name,
+            output_number,
+            "ON" if output_state else "OFF",
         )
 
     def cleanup(self) -> None:
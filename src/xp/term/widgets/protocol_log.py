@@ -84,4 +84,4 @@ class ProtocolLogWidget(Widget):
             self.service.on_telegram_display.disconnect(self._on_telegram_display)
 
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
@@ -9,13 +9,20 @@ Copyright (c) 2025 ld
 Licensed under MIT License - see LICENSE file for details.
 """
 
+import zlib
+from functools import lru_cache
+
 from xp.utils.serialization import nibble
 
 
+@lru_cache(maxsize=4096)
 def calculate_checksum(buffer: str) -> str:
     """
     Calculate simple XOR checksum of a string buffer.
 
+    Results are cached: polled requests, replies and event telegrams repeat
+    the same bodies throughout a session.
+
     Args:
         buffer: Input string to calculate checksum for
 
@@ -43,22 +50,8 @@ def calculate_checksum32(buffer: bytes) -> str:
     Returns:
         Eight-character checksum string in nibble format
     """
-    nibble_result = ""
-    crc = 0xFFFFFFFF  # Initialize to -1 (all bits set)
-
-    for byte in buffer:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ 0xEDB88320
-            else:
-                crc = crc >> 1
-
-    crc ^= 0xFFFFFFFF  # Final XOR
-
-    # Convert to nibble format (4 bytes, little-endian)
-    for _ in range(4):
-        nibble_result = nibble(crc & 0xFF) + nibble_result
-        crc >>= 8
+    # zlib implements the same reflected IEEE 802.3 CRC32 table-driven in C
+    crc = zlib.crc32(buffer)
 
-    return nibble_result
+    # Convert to nibble format (4 bytes, most significant first)
+    return "".join(nibble((crc >> shift) & 0xFF) for shift in (24, 16, 8, 0))
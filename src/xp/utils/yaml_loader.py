@@ -0,0 +1,47 @@
+"""Cached YAML loading for configuration files."""
+
+import copy
+import os
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Parsed documents by resolved path, with the (mtime in ns, size) they were read at
+_YAML_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
+
+def load_yaml(file_path: Union[str, Path]) -> Any:
+    """
+    Load a YAML file, reusing the parsed document while the file is unchanged.
+
+    Several services load the same configuration file in one process; the
+    file is only parsed again when its modification time or size changes.
+
+    Args:
+        file_path: Path to the YAML file.
+
+    Returns:
+        Parsed YAML document (a fresh copy for each call).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    path = Path(file_path).resolve()
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _YAML_CACHE.get(str(path))
+    if cached is None or cached[0] != version:
+        with path.open("r") as file:
+            cached = (version, yaml.load(file, Loader=SafeLoader))
+        _YAML_CACHE[str(path)] = cached
+
+    # Callers may mutate the returned data, keep the cached document intact
+    return copy.deepcopy(cached[1])
@@ -51,6 +51,7 @@ class TestActionTableDownloadServiceStateMachine:
         # Return a real ActionTable to avoid asdict() errors
         serializer.from_encoded_string = Mock(return_value=ActionTable(entries=[]))
         serializer.format_decoded_output = Mock(return_value=[])
+        serializer.to_short_string = Mock(return_value=[])
         return serializer
 
     @pytest.fixture
@@ -265,6 +266,7 @@ class TestActionTableDownloadServiceProtocolIntegration:
         # Return a real ActionTable to avoid asdict() errors
         serializer.from_encoded_string = Mock(return_value=ActionTable(entries=[]))
         serializer.format_decoded_output = Mock(return_value=[])
+        serializer.to_short_string = Mock(return_value=[])
         return serializer
 
     @pytest.fixture
@@ -360,6 +362,7 @@ class TestActionTableDownloadServiceContextManager:
         # Return a real ActionTable to avoid asdict() errors
         serializer.from_encoded_string = Mock(return_value=ActionTable(entries=[]))
         serializer.format_decoded_output = Mock(return_value=[])
+        serializer.to_short_string = Mock(return_value=[])
         return serializer
 
     @pytest.fixture
@@ -459,6 +462,7 @@ class TestActionTableDownloadServiceErrorHandling:
         serializer = Mock()
         serializer.from_encoded_string = Mock(return_value=ActionTable(entries=[]))
         serializer.format_decoded_output = Mock(return_value=[])
+        serializer.to_short_string = Mock(return_value=[])
         return serializer
 
     @pytest.fixture
@@ -586,3 +590,31 @@ class TestActionTableDownloadServiceErrorHandling:
 
         with service:
             assert service._error_retry_count == 0
+
+    def test_identical_data_decoded_once(self, service, mock_serializer):
+        """Test identical downloaded data reuses the earlier decoded table."""
+        mock_serializer.to_short_string.return_value = ["CP20 0 0 > 1 OFF;"]
+
+        first = service._decode_actiontable("AAAAAAAA")
+        second = service._decode_actiontable("AAAAAAAA")
+
+        assert first == second
+        mock_serializer.from_encoded_string.assert_called_once_with("AAAAAAAA")
+        mock_serializer.to_short_string.assert_called_once()
+
+        service._decode_actiontable("AAAAAAAB")
+        assert mock_serializer.from_encoded_string.call_count == 2
+
+    def test_cached_table_is_copied_for_each_caller(self, service, mock_serializer):
+        """Test callers of a cached decode cannot change each other's result."""
+        mock_serializer.to_short_string.return_value = ["CP20 0 0 > 1 OFF;"]
+
+        first_table, first_short = service._decode_actiontable("AAAAAAAA")
+        second_table, second_short = service._decode_actiontable("AAAAAAAA")
+        first_short.append("CP20 0 1 > 1 ON;")
+        first_table.entries.append(Mock())
+
+        assert first_table is not second_table
+        assert second_short == ["CP20 0 0 > 1 OFF;"]
+        assert second_table.entries == []
+        assert service._decode_actiontable("AAAAAAAA")[1] == ["CP20 0 0 > 1 OFF;"]
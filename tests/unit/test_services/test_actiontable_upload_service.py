@@ -173,6 +173,29 @@ class TestActionTableUploadService:
             data_value="00",
         )
 
+    def test_encoded_msactiontable_uses_module_type_serializer(
+        self, service, mock_serializer, mock_xp24ms_serializer
+    ):
+        """Test MS action table encoding picks the serializer by module type."""
+        service.actiontable_type = ActionTableType2.MSACTIONTABLE
+        module = Mock(module_type="XP24", xp24_msaction_table=["T:1 ON"])
+        mock_xp24ms_serializer.to_encoded_string.return_value = "AAAB"
+
+        assert service.get_encoded_action_table(module) == "AAAB"
+        mock_xp24ms_serializer.from_short_string.assert_called_once_with(["T:1 ON"])
+        mock_serializer.from_short_string.assert_not_called()
+
+    def test_encoded_msactiontable_falls_back_to_actiontable(
+        self, service, mock_serializer
+    ):
+        """Test MS upload of an unknown module type encodes the action table."""
+        service.actiontable_type = ActionTableType2.MSACTIONTABLE
+        module = Mock(module_type="CP20", action_table=None)
+        mock_serializer.to_encoded_string.return_value = "AAAA"
+
+        assert service.get_encoded_action_table(module) == "AAAA"
+        mock_serializer.from_short_string.assert_called_once_with([])
+
 
 class TestActionTableUploadChunkPrefix:
     """Test cases for chunk prefix sequence (AA, AB, AC, AD...)."""
@@ -0,0 +1,87 @@
+"""Unit tests for ConbusBlinkAllService."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
+from xp.models.telegram.system_function import SystemFunction
+from xp.models.telegram.telegram_type import TelegramType
+from xp.services.conbus.conbus_blink_all_service import ConbusBlinkAllService
+from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+
+
+class TestConbusBlinkAllService:
+    """Unit tests for ConbusBlinkAllService functionality."""
+
+    @pytest.fixture
+    def mock_conbus_protocol(self):
+        """Create a mock ConbusEventProtocol."""
+        return Mock(spec=ConbusEventProtocol)
+
+    @pytest.fixture
+    def mock_telegram_service(self):
+        """Create a mock telegram service."""
+        return Mock()
+
+    @pytest.fixture
+    def service(self, mock_conbus_protocol, mock_telegram_service):
+        """Create service instance with test dependencies."""
+        return ConbusBlinkAllService(
+            conbus_protocol=mock_conbus_protocol,
+            telegram_service=mock_telegram_service,
+        )
+
+    def test_discovery_received_sends_blink(self, service, mock_conbus_protocol):
+        """Test a discovered module is sent a blink telegram."""
+        service.send_blink_all_telegram("on")
+
+        service.discovery_received(Mock(serial_number="0012345011"))
+
+        mock_conbus_protocol.send_telegram.assert_called_once_with(
+            telegram_type=TelegramType.SYSTEM,
+            serial_number="0012345011",
+            system_function=SystemFunction.BLINK,
+            data_value="00",
+        )
+
+    def test_blink_reply_reports_progress_without_parsing(
+        self, service, mock_conbus_protocol, mock_telegram_service
+    ):
+        """Test blink replies emit progress without a full reply parse."""
+        progress: list[str] = []
+        service.on_progress.connect(progress.append)
+
+        service.telegram_received(
+            TelegramReceivedEvent(
+                protocol=mock_conbus_protocol,
+                frame="<R0012345011F18DFA>",
+                telegram="R0012345011F18DFA",
+                payload="R0012345011F18D",
+                telegram_type="R",
+                serial_number="0012345011",
+                checksum="FA",
+                checksum_valid=True,
+            )
+        )
+        assert progress == []
+
+        service.telegram_received(
+            TelegramReceivedEvent(
+                protocol=mock_conbus_protocol,
+                frame="<R0012345011F05DFB>",
+                telegram="R0012345011F05DFB",
+                payload="R0012345011F05D",
+                telegram_type="R",
+                serial_number="0012345011",
+                checksum="FB",
+                checksum_valid=True,
+            )
+        )
+
+        assert progress == ["."]
+        mock_telegram_service.parse_reply_telegram.assert_not_called()
+        assert service.service_response.received_telegrams == [
+            "<R0012345011F18DFA>",
+            "<R0012345011F05DFB>",
+        ]
@@ -99,6 +99,18 @@ class TestConbusBlinkService:
         assert service.service_response.operation == "off"
         mock_conbus_protocol.send_telegram.assert_called_once()
 
+    def test_connection_made_blink_on_is_case_insensitive(
+        self, service, mock_conbus_protocol
+    ):
+        """Test connection_made maps 'ON' to the blink system function."""
+        service.serial_number = "0012345008"
+        service.on_or_off = "ON"
+
+        service.connection_made()
+
+        assert service.service_response.system_function == SystemFunction.BLINK
+        mock_conbus_protocol.send_telegram.assert_called_once()
+
     def test_telegram_sent(self, service, mock_telegram_service):
         """Test telegram_sent callback updates service response."""
         from xp.models.telegram.system_telegram import SystemTelegram
@@ -0,0 +1,93 @@
+"""Unit tests for ConbusDatapointQueryAllService."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from xp.models import ConbusDatapointResponse
+from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
+from xp.models.telegram.datapoint_type import DataPointType
+from xp.models.telegram.system_function import SystemFunction
+from xp.services.conbus.conbus_datapoint_queryall_service import (
+    ConbusDatapointQueryAllService,
+)
+from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+
+
+class TestConbusDatapointQueryAllService:
+    """Unit tests for ConbusDatapointQueryAllService functionality."""
+
+    @pytest.fixture
+    def mock_conbus_protocol(self):
+        """Create a mock ConbusEventProtocol."""
+        return Mock(spec=ConbusEventProtocol)
+
+    @pytest.fixture
+    def mock_telegram_service(self):
+        """Create a mock telegram service."""
+        return Mock()
+
+    @pytest.fixture
+    def service(self, mock_conbus_protocol, mock_telegram_service):
+        """Create service instance with test dependencies."""
+        service = ConbusDatapointQueryAllService(
+            conbus_protocol=mock_conbus_protocol,
+            telegram_service=mock_telegram_service,
+        )
+        service.query_all_datapoints(serial_number="0012345011")
+        return service
+
+    def reply(self, protocol):
+        """Create a reply event from the queried module."""
+        return TelegramReceivedEvent(
+            protocol=protocol,
+            frame="<R0012345011F02D00XP24FA>",
+            telegram="R0012345011F02D00XP24FA",
+            payload="R0012345011F02D00XP24",
+            telegram_type="R",
+            serial_number="0012345011",
+            checksum="FA",
+            checksum_valid=True,
+        )
+
+    def test_connection_made_queues_every_datapoint(
+        self, service, mock_conbus_protocol
+    ):
+        """Test all datapoint reads are queued without waiting for replies."""
+        service.connection_made()
+
+        assert mock_conbus_protocol.send_telegram.call_count == len(DataPointType)
+
+    def test_finishes_when_every_datapoint_answered(
+        self, service, mock_conbus_protocol, mock_telegram_service
+    ):
+        """Test the query finishes on the last reply instead of a timeout."""
+        finished: list[ConbusDatapointResponse] = []
+        service.on_finish.connect(finished.append)
+        service.connection_made()
+
+        for datapoint_type in DataPointType:
+            assert not finished
+            mock_telegram_service.parse_reply_telegram.return_value = Mock(
+                system_function=SystemFunction.READ_DATAPOINT,
+                datapoint_type=datapoint_type,
+            )
+            service.telegram_received(self.reply(mock_conbus_protocol))
+
+        assert len(finished) == 1
+        assert finished[0].success is True
+
+    def test_timeout_ignored_while_queries_unsent(self, service):
+        """Test a quiet gap between paced sends does not end the query."""
+        finished: list[ConbusDatapointResponse] = []
+        service.on_finish.connect(finished.append)
+        service.connection_made()
+
+        service.telegram_sent("<S0012345011F02D00FA>")
+        service.timeout()
+        assert not finished
+
+        for _ in range(len(DataPointType) - 1):
+            service.telegram_sent("<S0012345011F02D00FA>")
+        service.timeout()
+        assert len(finished) == 1
@@ -0,0 +1,67 @@
+"""Unit tests for ConbusDiscoverService."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
+from xp.services.conbus.conbus_discover_service import ConbusDiscoverService
+from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+
+
+class TestConbusDiscoverService:
+    """Unit tests for ConbusDiscoverService reply dispatch."""
+
+    @pytest.fixture
+    def mock_conbus_protocol(self):
+        """Create a mock ConbusEventProtocol."""
+        return Mock(spec=ConbusEventProtocol)
+
+    @pytest.fixture
+    def service(self, mock_conbus_protocol):
+        """Create service instance with test dependencies."""
+        return ConbusDiscoverService(conbus_protocol=mock_conbus_protocol)
+
+    def reply(self, payload, checksum_valid=True):
+        """Create a reply event for the given payload."""
+        return TelegramReceivedEvent(
+            protocol=Mock(spec=ConbusEventProtocol),
+            frame=f"<{payload}FA>",
+            telegram=f"{payload}FA",
+            payload=payload,
+            telegram_type=payload[0],
+            serial_number=payload[1:11],
+            checksum="FA",
+            checksum_valid=checksum_valid,
+        )
+
+    def test_discovery_reply_registers_device(self, service):
+        """Test a discovery reply is handled as a discovered device."""
+        with patch.object(service, "handle_discovered_device") as mock_handle:
+            service.telegram_received(self.reply("R0012345011F01D"))
+
+        mock_handle.assert_called_once_with("0012345011")
+
+    def test_module_type_replies_are_dispatched(self, service):
+        """Test module type and module type code replies reach their handlers."""
+        with (
+            patch.object(service, "handle_module_type_response") as mock_type,
+            patch.object(service, "handle_module_type_code_response") as mock_code,
+        ):
+            service.telegram_received(self.reply("R0012345011F02D0007"))
+            service.telegram_received(self.reply("R0012345011F02D0724"))
+
+        mock_type.assert_called_once_with("0012345011", "07")
+        mock_code.assert_called_once_with("0012345011", "24")
+
+    def test_invalid_checksum_reply_is_ignored(self, service):
+        """Test replies with an invalid checksum are not dispatched."""
+        with patch.object(service, "handle_discovered_device") as mock_handle:
+            service.telegram_received(
+                self.reply("R0012345011F01D", checksum_valid=False)
+            )
+
+        mock_handle.assert_not_called()
+        assert service.discovered_device_result.received_telegrams == [
+            "<R0012345011F01DFA>"
+        ]
@@ -4,8 +4,14 @@ import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
+from twisted.internet.defer import Deferred
+from twisted.internet.interfaces import ITCPTransport
+from zope.interface import directlyProvides
 
 from xp.models import ConbusClientConfig
+from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
+from xp.models.telegram.reply_telegram import ReplyTelegram
+from xp.models.telegram.system_function import SystemFunction
 from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
 
 
@@ -153,3 +159,134 @@ class TestConbusEventProtocol:
 
             # Verify queue manager was scheduled
             mock_call_later.assert_called_once()
+
+    def test_emit_telegram_received_dispatches_discovery(
+        self, protocol, mock_telegram_service
+    ):
+        """Test discovery replies are parsed once and emitted on their signal."""
+        reply_telegram = Mock(system_function=SystemFunction.DISCOVERY)
+        mock_telegram_service.parse_reply_telegram.return_value = reply_telegram
+        received: list[ReplyTelegram] = []
+        protocol.on_discovery_received.connect(received.append)
+
+        try:
+            protocol.emit_telegram_received(
+                TelegramReceivedEvent(
+                    protocol=protocol,
+                    frame="<R0012345011F01DFM>",
+                    telegram="R0012345011F01DFM",
+                    payload="R0012345011F01D",
+                    telegram_type="R",
+                    serial_number="0012345011",
+                    checksum="FM",
+                    checksum_valid=True,
+                )
+            )
+        finally:
+            protocol.on_discovery_received.disconnect(received.append)
+
+        mock_telegram_service.parse_reply_telegram.assert_called_once_with(
+            "<R0012345011F01DFM>"
+        )
+        assert received == [reply_telegram]
+
+    def test_emit_telegram_received_skips_parse_for_unhandled_function(
+        self, protocol, mock_telegram_service
+    ):
+        """Test replies without a dispatch handler are not parsed."""
+        protocol.emit_telegram_received(
+            TelegramReceivedEvent(
+                protocol=protocol,
+                frame="<R0012345011F18DFA>",
+                telegram="R0012345011F18DFA",
+                payload="R0012345011F18D",
+                telegram_type="R",
+                serial_number="0012345011",
+                checksum="FA",
+                checksum_valid=True,
+            )
+        )
+
+        mock_telegram_service.parse_reply_telegram.assert_not_called()
+
+    def test_defer_to_thread_uses_reactor_thread_pool(self, protocol, mock_reactor):
+        """Test defer_to_thread runs the callable in the reactor thread pool."""
+        action = Mock()
+
+        deferred = protocol.defer_to_thread(action, "export.yml")
+
+        assert isinstance(deferred, Deferred)
+        thread_pool = mock_reactor.getThreadPool.return_value
+        thread_pool.callInThreadWithCallback.assert_called_once()
+
+    def test_send_raw_telegram_skips_wakeup_when_queue_manager_running(self, protocol):
+        """Test send_raw_telegram does not reschedule a running queue manager."""
+        protocol.queue_manager_running = True
+        with patch.object(protocol, "call_later") as mock_call_later:
+            protocol.send_raw_telegram("S0012345011F18D00")
+
+            assert protocol.telegram_queue.get_nowait() == b"S0012345011F18D00"
+            mock_call_later.assert_not_called()
+
+    def test_telegram_received_event_str_is_frame(self, protocol):
+        """Test received events log as their frame rather than every field."""
+        event = TelegramReceivedEvent(
+            protocol=protocol,
+            frame="<R0012345011F18DFA>",
+            telegram="R0012345011F18DFA",
+            payload="R0012345011F18D",
+            telegram_type="R",
+            serial_number="0012345011",
+            checksum="FA",
+            checksum_valid=True,
+        )
+
+        assert str(event) == "<R0012345011F18DFA>"
+        event.checksum_valid = False
+        assert str(event) == "<R0012345011F18DFA> (invalid checksum)"
+
+    def test_connection_made_tunes_tcp_transport(self, protocol):
+        """Test connectionMade turns on TCP_NODELAY and keepalive."""
+        transport = Mock()
+        directlyProvides(transport, ITCPTransport)
+        protocol.transport = transport
+
+        with patch.object(protocol, "_reset_timeout"):
+            protocol.connectionMade()
+
+        transport.setTcpNoDelay.assert_called_once_with(True)
+        transport.setTcpKeepAlive.assert_called_once_with(True)
+
+    def test_data_received_frames_chunks_and_keeps_partial_tail(self, protocol):
+        """Test several frames per chunk are split and a partial one is kept."""
+        frames: list[TelegramReceivedEvent] = []
+        with (
+            patch.object(protocol, "_reset_timeout"),
+            patch.object(protocol, "emit_telegram_received", side_effect=frames.append),
+        ):
+            protocol.dataReceived(b"<E14L00I02MAK><E14L00I02BAK><E14L0")
+            assert [event.frame for event in frames] == [
+                "<E14L00I02MAK>",
+                "<E14L00I02BAK>",
+            ]
+            assert protocol.buffer == b"<E14L0"
+
+            protocol.dataReceived(b"0I03MAN>")
+
+        assert frames[-1].frame == "<E14L00I03MAN>"
+        assert protocol.buffer == b""
+
+    def test_send_frame_writes_checksummed_frame(self, protocol):
+        """Test sendFrame writes the bracketed frame with its checksum."""
+        protocol.transport = Mock()
+        sent: list[str] = []
+        protocol.on_telegram_sent.connect(sent.append)
+
+        try:
+            with patch.object(protocol, "_reset_timeout"):
+                protocol.sendFrame(b"S0012345011F02D18")
+        finally:
+            protocol.on_telegram_sent.disconnect(sent.append)
+
+        protocol.transport.write.assert_called_once_with(b"<S0012345011F02D18FL>")
+        assert sent == ["<S0012345011F02D18FL>"]
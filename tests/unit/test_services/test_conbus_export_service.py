@@ -0,0 +1,183 @@
+"""Unit tests for ConbusExportService."""
+
+from unittest.mock import MagicMock, call
+
+import pytest
+from twisted.internet.defer import maybeDeferred
+
+from xp.models.conbus.conbus_export import ConbusExportResponse
+from xp.models.config.conson_module_config import ConsonModuleConfig
+from xp.models.telegram.datapoint_type import DataPointType
+from xp.services.conbus.conbus_export_service import ConbusExportService
+from xp.services.protocol.conbus_event_protocol import ConbusEventProtocol
+from xp.services.telegram.telegram_service import TelegramService
+
+COMPLETE_DATAPOINTS = {
+    DataPointType.MODULE_TYPE: "XP24",
+    DataPointType.MODULE_TYPE_CODE: "07",
+    DataPointType.LINK_NUMBER: "12",
+    DataPointType.MODULE_NUMBER: "1",
+    DataPointType.SW_VERSION: "XP24_V0.34.03",
+    DataPointType.HW_VERSION: "XP24_HW_V1",
+    DataPointType.AUTO_REPORT_STATUS: "PP",
+}
+
+
+class TestConbusExportService:
+    """Unit tests for ConbusExportService functionality."""
+
+    @pytest.fixture
+    def mock_conbus_protocol(self):
+        """Create a mock ConbusEventProtocol."""
+        protocol = MagicMock(spec=ConbusEventProtocol)
+        protocol.timeout_seconds = 5.0
+        # Run "threaded" work synchronously
+        protocol.defer_to_thread.side_effect = maybeDeferred
+        return protocol
+
+    @pytest.fixture
+    def export_service(self, mock_conbus_protocol, tmp_path, monkeypatch):
+        """Create a ConbusExportService writing its export into a temp directory."""
+        monkeypatch.chdir(tmp_path)
+        service = ConbusExportService(
+            conbus_protocol=mock_conbus_protocol,
+            telegram_service=MagicMock(spec=TelegramService),
+        )
+        with service:
+            yield service
+
+    def complete_device(self, service, serial_number):
+        """Feed every datapoint of the export sequence for a device."""
+        for datapoint, value in COMPLETE_DATAPOINTS.items():
+            service._handle_datapoint_response(serial_number, datapoint, value)
+
+    @staticmethod
+    def raise_os_error() -> None:
+        """Simulate a failing file write."""
+        raise OSError("disk full")
+
+    def test_duplicate_discovery_is_ignored(self, export_service, mock_conbus_protocol):
+        """Test that a device discovered twice is only queried once."""
+        export_service._handle_discovery_response("0012345011")
+        export_service._handle_discovery_response("0012345011")
+
+        assert export_service.discovered_devices == ["0012345011"]
+        mock_conbus_protocol.send_raw_telegram.assert_has_calls(
+            [
+                call(f"S0012345011F02D{datapoint.value}")
+                for datapoint in ConbusExportService.DATAPOINT_SEQUENCE
+            ]
+        )
+        assert mock_conbus_protocol.send_raw_telegram.call_count == len(
+            ConbusExportService.DATAPOINT_SEQUENCE
+        )
+
+    def test_device_exported_once_and_export_finalized(self, export_service):
+        """Test that completing all devices emits each device once and finalizes."""
+        exported: list[ConsonModuleConfig] = []
+        finished: list[ConbusExportResponse] = []
+        export_service.on_device_exported.connect(exported.append)
+        export_service.on_finish.connect(finished.append)
+
+        export_service._handle_discovery_response("0012345011")
+        export_service._handle_discovery_response("0012345012")
+        self.complete_device(export_service, "0012345011")
+
+        assert len(exported) == 1
+        assert not finished
+
+        self.complete_device(export_service, "0012345012")
+        # A late duplicate datapoint must not re-emit the device
+        export_service._handle_datapoint_response(
+            "0012345012", DataPointType.SW_VERSION, "XP24_V0.34.03"
+        )
+
+        assert [m.serial_number for m in exported] == ["0012345011", "0012345012"]
+        assert len(finished) == 1
+        assert finished[0].success is True
+        assert finished[0].export_status == "OK"
+        assert finished[0].device_count == 2
+
+    def test_export_file_written_off_reactor_thread(
+        self, export_service, mock_conbus_protocol, tmp_path
+    ):
+        """Test that the export file is written through the protocol thread pool."""
+        export_service._handle_discovery_response("0012345011")
+        self.complete_device(export_service, "0012345011")
+
+        mock_conbus_protocol.defer_to_thread.assert_called_once()
+        content = (tmp_path / "export.yml").read_text()
+        assert content.startswith("- name: A12\n  serial_number: '0012345011'\n")
+        assert "enabled" not in content
+        assert export_service.export_result.output_file == "export.yml"
+
+    def test_export_write_failure(self, export_service, mock_conbus_protocol):
+        """Test that a failed file write finishes the export as FAILED_WRITE."""
+        finished: list[ConbusExportResponse] = []
+        export_service.on_finish.connect(finished.append)
+        mock_conbus_protocol.defer_to_thread.side_effect = lambda *_args: maybeDeferred(
+            self.raise_os_error
+        )
+
+        export_service._handle_discovery_response("0012345011")
+        self.complete_device(export_service, "0012345011")
+
+        assert finished[0].success is False
+        assert finished[0].export_status == "FAILED_WRITE"
+        assert finished[0].error == "disk full"
+
+    def test_timeout_with_incomplete_device(self, export_service):
+        """Test that timeout marks a partial export when devices are incomplete."""
+        finished: list[ConbusExportResponse] = []
+        export_service.on_finish.connect(finished.append)
+
+        export_service._handle_discovery_response("0012345011")
+        export_service._handle_datapoint_response(
+            "0012345011", DataPointType.LINK_NUMBER, "12"
+        )
+        export_service.timeout()
+
+        assert export_service.export_status == "FAILED_TIMEOUT"
+        assert finished[0].device_count == 1
+
+    def test_progress_is_emitted_in_batches(self, export_service, mock_conbus_protocol):
+        """Test that discovery progress is coalesced into batches."""
+        batches: list[list[tuple[str, int, int]]] = []
+        export_service.on_progress.connect(batches.append)
+        batch_size = ConbusExportService.PROGRESS_BATCH_SIZE
+
+        for i in range(batch_size + 1):
+            export_service._handle_discovery_response(f"00123450{i:02d}")
+
+        assert len(batches) == 1
+        assert batches[0][0] == ("0012345000", 1, 1)
+        assert len(batches[0]) == batch_size
+        mock_conbus_protocol.call_later.assert_called_once_with(
+            ConbusExportService.PROGRESS_FLUSH_DELAY, export_service._flush_progress
+        )
+
+        # Delayed flush emits the remaining partial batch
+        export_service._flush_progress()
+
+        assert batches[1] == [
+            (f"00123450{batch_size:02d}", batch_size + 1, batch_size + 1)
+        ]
+
+    def test_completed_module_rendered_before_finalize(self, export_service, tmp_path):
+        """Test that modules are serialized on completion and sorted at finalize."""
+        export_service._handle_discovery_response("0012345011")
+        export_service._handle_discovery_response("0012345012")
+        self.complete_device(export_service, "0012345011")
+
+        assert "0012345011" in export_service._rendered_modules
+        assert not (tmp_path / "export.yml").exists()
+
+        export_service._handle_datapoint_response(
+            "0012345012", DataPointType.LINK_NUMBER, "3"
+        )
+        export_service.timeout()
+
+        content = (tmp_path / "export.yml").read_text()
+        entries = content.split("\n\n")
+        assert entries[0].startswith("- name: A3\n")
+        assert entries[1] == export_service._rendered_modules["0012345011"]
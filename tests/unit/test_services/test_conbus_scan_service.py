@@ -145,6 +145,79 @@ class TestConbusScanService:
         assert service.service_response.received_telegrams == ["<R0012345678F02D05XX>"]
         progress_mock.assert_called_once_with("<R0012345678F02D05XX>")
 
+    def test_reply_advances_scan_without_timeout(self, service, mock_conbus_protocol):
+        """Test a reply from the scanned module immediately scans the next code."""
+        from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
+
+        service.serial_number = "0012345678"
+        service.function_code = "02"
+        service.scan_next_datacode()
+        mock_conbus_protocol.sendFrame.reset_mock()
+
+        telegram_event = TelegramReceivedEvent.model_construct(
+            protocol=mock_conbus_protocol,
+            frame="<R0012345678F02D00XX>",
+            telegram="R0012345678F02D00XX",
+            payload="R0012345678F02D00",
+            telegram_type="R",
+            serial_number="0012345678",
+            checksum="XX",
+            checksum_valid=True,
+        )
+        service.telegram_received(telegram_event)
+        # A second reply for the same code must not skip a datacode
+        service.telegram_received(telegram_event)
+
+        mock_conbus_protocol.sendFrame.assert_called_once_with(b"S0012345678F02D01")
+        assert service.datapoint_value == 1
+
+    def test_late_ack_after_timeout_does_not_skip_datacode(
+        self, service, mock_conbus_protocol
+    ):
+        """Test an ACK arriving after a timeout advance is not taken as the answer."""
+        from xp.models.protocol.conbus_protocol import TelegramReceivedEvent
+
+        service.serial_number = "0012345678"
+        service.function_code = "02"
+        service.scan_next_datacode()
+        # No reply for 00 in time, the scan moves on to 01
+        service.timeout()
+        mock_conbus_protocol.sendFrame.reset_mock()
+
+        late_ack = TelegramReceivedEvent.model_construct(
+            protocol=mock_conbus_protocol,
+            frame="<R0012345678F18DXX>",
+            telegram="R0012345678F18DXX",
+            payload="R0012345678F18D",
+            telegram_type="R",
+            serial_number="0012345678",
+            checksum="XX",
+            checksum_valid=True,
+        )
+        service.telegram_received(late_ack)
+
+        mock_conbus_protocol.sendFrame.assert_not_called()
+        assert service.datapoint_value == 1
+
+        # The echoed reply for 01 still advances the scan
+        service.telegram_received(
+            TelegramReceivedEvent.model_construct(
+                protocol=mock_conbus_protocol,
+                frame="<R0012345678F02D01XX>",
+                telegram="R0012345678F02D01XX",
+                payload="R0012345678F02D01",
+                telegram_type="R",
+                serial_number="0012345678",
+                checksum="XX",
+                checksum_valid=True,
+            )
+        )
+
+        mock_conbus_protocol.sendFrame.assert_called_once_with(b"S0012345678F02D02")
+        # Once answered in step, an ACK for 02 is unambiguous again
+        service.telegram_received(late_ack)
+        assert service.datapoint_value == 3
+
     def test_timeout(self, service, mock_conbus_protocol):
         """Test timeout callback scans next datacode."""
         service.serial_number = "0012345678"
@@ -1,5 +1,8 @@
 """Tests for ServerService."""
 
+import socket
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -560,3 +563,62 @@ class TestServerServiceDeviceTypes:
         service = ServerService(telegram_service, discover_service, mock_device_factory)
 
         assert "23023" in service.device_services
+
+
+class TestServerServiceClientHandling:
+    """Test ServerService client connection handling."""
+
+    @patch("xp.services.server.server_service.Path")
+    def test_queued_telegram_sent_without_client_request(
+        self, mock_path, mock_device_factory
+    ):
+        """Test telegrams broadcast to a silent client are delivered promptly."""
+        mock_path.return_value.exists.return_value = False
+        service = ServerService(
+            TelegramService(), TelegramDiscoverService(), mock_device_factory
+        )
+        server_side, client_side = socket.socketpair()
+        client_side.settimeout(2.0)
+
+        handler = threading.Thread(
+            target=service._handle_client, args=(server_side, ("127.0.0.1", 0))
+        )
+        handler.start()
+        try:
+            while not service.client_buffers.get_queue(server_side):
+                time.sleep(0.01)
+            # Let the handler settle into waiting for client data
+            time.sleep(0.2)
+            service.client_buffers.broadcast("<E14L00I02MAK>")
+
+            assert client_side.recv(1024) == b"<E14L00I02MAK>"
+        finally:
+            client_side.close()
+            handler.join(timeout=2.0)
+
+        assert not handler.is_alive()
+
+    @patch("xp.services.server.server_service.Path")
+    def test_telegram_split_across_reads_is_reassembled(
+        self, mock_path, mock_device_factory
+    ):
+        """Test a telegram arriving in two reads is processed once, whole."""
+        mock_path.return_value.exists.return_value = False
+        service = ServerService(
+            TelegramService(), TelegramDiscoverService(), mock_device_factory
+        )
+        server_side, client_side = socket.socketpair()
+
+        with patch.object(service, "_process_request", return_value=[]) as process:
+            handler = threading.Thread(
+                target=service._handle_client, args=(server_side, ("127.0.0.1", 0))
+            )
+            handler.start()
+            client_side.sendall(b"<S0012345008F0")
+            time.sleep(0.2)
+            client_side.sendall(b"2D00FN>")
+            time.sleep(0.2)
+            client_side.close()
+            handler.join(timeout=2.0)
+
+        process.assert_called_once_with("<S0012345008F02D00FN>")
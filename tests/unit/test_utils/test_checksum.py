@@ -47,6 +47,16 @@ class TestChecksumUtilities:
         # 'A' = ASCII 65 = 0x41, nibble should be "EB"
         assert result == "EB"
 
+    def test_calculate_checksum_is_cached(self):
+        """Test repeated bodies reuse the cached checksum."""
+        calculate_checksum.cache_clear()
+
+        first = calculate_checksum("S0012345008F05D00")
+        second = calculate_checksum("S0012345008F05D00")
+
+        assert first == second == "FN"
+        assert calculate_checksum.cache_info().hits == 1
+
     def test_nibble_conversion(self):
         """Test nibble conversion function."""
         # Test zero
@@ -131,9 +141,8 @@ class TestChecksumUtilities:
         data = b"123456789"
         result = calculate_checksum32(data)
 
-        # The result should be consistent
-        assert isinstance(result, str)
-        assert len(result) == 8
+        # CRC32 check value 0xCBF43926 in nibble format
+        assert result == "MLPEDJCG"
 
         # Test that multiple calls produce same result
         result2 = calculate_checksum32(data)
@@ -0,0 +1,60 @@
+"""Tests for cached YAML loading."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from xp.utils.yaml_loader import load_yaml
+
+
+class TestLoadYaml:
+    """Test load_yaml function."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test repeated loads of an unchanged file reuse the parsed document."""
+        config = tmp_path / "cli.yml"
+        config.write_text("conbus:\n  ip: 10.0.0.1\n")
+
+        with patch("xp.utils.yaml_loader.yaml.load") as mock_load:
+            mock_load.return_value = {"conbus": {"ip": "10.0.0.1"}}
+            first = load_yaml(config)
+            second = load_yaml(str(config))
+
+        mock_load.assert_called_once()
+        assert first == second == {"conbus": {"ip": "10.0.0.1"}}
+
+    def test_returned_data_is_a_copy(self, tmp_path):
+        """Test mutating a loaded document does not affect later loads."""
+        config = tmp_path / "conson.yml"
+        config.write_text("- name: A1\n")
+
+        load_yaml(config)[0]["name"] = "changed"
+
+        assert load_yaml(config) == [{"name": "A1"}]
+
+    def test_modified_file_is_parsed_again(self, tmp_path):
+        """Test a file is re-parsed once its content changes."""
+        config = tmp_path / "conson.yml"
+        config.write_text("- name: A1\n")
+        assert load_yaml(config) == [{"name": "A1"}]
+
+        config.write_text("- name: A22\n")
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_yaml(config) == [{"name": "A22"}]
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_yaml(tmp_path / "missing.yml")
+
+    def test_rejects_unsafe_tags(self, tmp_path):
+        """Test the loader stays a safe loader."""
+        config = tmp_path / "cli.yml"
+        config.write_text("!!python/object/apply:os.system ['true']\n")
+
+        with pytest.raises(yaml.YAMLError):
+            load_yaml(config)